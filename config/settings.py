@@ -4,6 +4,10 @@ Configuración del Simulador Matemático
 
 import matplotlib
 matplotlib.use('TkAgg')  # Backend para tkinter
+# Simplificar trazos en Agg: se unen segmentos que se desvían menos de un píxel
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
 import matplotlib.pyplot as plt
 import customtkinter as ctk
 
@@ -26,6 +30,17 @@ PLOT_CONFIG = {
     "legend": True
 }
 
+# Colores que el estilo oscuro ya usa para ticks, bordes y grilla; fijarlos
+# globalmente no cambia ningún gráfico y evita reaplicarlos eje por eje.
+# El fondo de los ejes, la transparencia de la grilla, el tamaño de los ticks
+# y el marco de la leyenda siguen siendo por eje (apply_standard_plot_styling).
+PLOT_RC_PARAMS = {
+    "xtick.color": "white",
+    "ytick.color": "white",
+    "axes.edgecolor": "white",
+    "grid.color": "white",
+}
+
 # Configuración numérica
 NUMERICAL_CONFIG = {
     "default_tolerance": 1e-6,
@@ -43,6 +58,7 @@ def configure_ui():
 def configure_matplotlib():
     """Configura matplotlib para el tema oscuro"""
     plt.style.use(PLOT_CONFIG["style"])
+    plt.rcParams.update(PLOT_RC_PARAMS)
 
 # Alias para compatibilidad
 UI_SETTINGS = UI_CONFIG
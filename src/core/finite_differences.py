@@ -525,7 +525,8 @@ class FiniteDifferences:
             fx_plus_h = f_func(x + h)
             
             # Calcular derivada
-            derivative = (fx_plus_h - fx) / h
+            numerator = fx_plus_h - fx
+            derivative = numerator / h
             
             return {
                 'method': 'progressive',
@@ -533,6 +534,8 @@ class FiniteDifferences:
                 'h': h,
                 'fx': fx,
                 'fx_plus_h': fx_plus_h,
+                'numerator': numerator,
+                'denominator': h,
                 'derivative': derivative,
                 'error_order': 'O(h)',
                 'formula': "f'(x) ≈ [f(x+h) - f(x)] / h",
@@ -569,7 +572,8 @@ class FiniteDifferences:
             fx_minus_h = f_func(x - h)
             
             # Calcular derivada
-            derivative = (fx - fx_minus_h) / h
+            numerator = fx - fx_minus_h
+            derivative = numerator / h
             
             return {
                 'method': 'regressive',
@@ -577,6 +581,8 @@ class FiniteDifferences:
                 'h': h,
                 'fx': fx,
                 'fx_minus_h': fx_minus_h,
+                'numerator': numerator,
+                'denominator': h,
                 'derivative': derivative,
                 'error_order': 'O(h)',
                 'formula': "f'(x) ≈ [f(x) - f(x-h)] / h",
@@ -614,7 +620,9 @@ class FiniteDifferences:
             fx = f_func(x)  # Para información completa
             
             # Calcular derivada
-            derivative = (fx_plus_h - fx_minus_h) / (2 * h)
+            numerator = fx_plus_h - fx_minus_h
+            denominator = 2 * h
+            derivative = numerator / denominator
             
             return {
                 'method': 'central',
@@ -623,6 +631,8 @@ class FiniteDifferences:
                 'fx': fx,
                 'fx_plus_h': fx_plus_h,
                 'fx_minus_h': fx_minus_h,
+                'numerator': numerator,
+                'denominator': denominator,
                 'derivative': derivative,
                 'error_order': 'O(h²)',
                 'formula': "f'(x) ≈ [f(x+h) - f(x-h)] / (2h)",
@@ -739,6 +749,126 @@ class FiniteDifferences:
             self.logger.error(f"Error en cálculo automático por lista: {e}")
             raise ValueError(f"Error en auto_calculate_list: {e}")
     
+    def auto_calculate_list_vec(self, x_values, fx_values, h: float) -> List[Dict]:
+        """
+        Versión vectorizada de auto_calculate_list para puntos con f(x) conocido.
+        
+        Produce los mismos resultados que auto_calculate_list con un 'h' común,
+        pero evalúa las rectas de los extremos y las parábolas de Lagrange de
+        los puntos intermedios sobre arreglos de NumPy en lugar de punto a punto.
+        
+        Args:
+            x_values: Secuencia de valores x
+            fx_values: Secuencia de valores f(x) correspondientes
+            h: Tamaño de paso común
+            
+        Returns:
+            Lista de diccionarios con resultados de derivadas
+        """
+        try:
+            x = np.asarray(x_values, dtype=float)
+            fx = np.asarray(fx_values, dtype=float)
+            n_points = x.size
+            
+            if n_points == 0:
+                raise ValueError("La lista de puntos no puede estar vacía")
+            if fx.size != n_points:
+                raise ValueError("x y f(x) deben tener la misma cantidad de valores")
+            if h <= 0:
+                raise ValueError("h debe ser positivo")
+            if h >= 1:
+                self.logger.warning(f"h={h} es muy grande, puede afectar precisión")
+            
+            fx_plus_h = np.full(n_points, np.nan)
+            fx_minus_h = np.full(n_points, np.nan)
+            
+            if n_points == 1:
+                # Un solo punto: función constante y método central
+                fx_plus_h[0] = fx_minus_h[0] = fx[0]
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    # Extremos: recta por el punto adyacente
+                    slopes = np.diff(fx) / np.diff(x)
+                    fx_plus_h[0] = fx[0] + slopes[0] * h
+                    fx_minus_h[-1] = fx[-1] - slopes[-1] * h
+                    
+                    # Intermedios: interpolación de Lagrange con los vecinos
+                    if n_points > 2:
+                        x0, x1, x2 = x[:-2], x[1:-1], x[2:]
+                        y0, y1, y2 = fx[:-2], fx[1:-1], fx[2:]
+                        d0 = (x0 - x1) * (x0 - x2)
+                        d1 = (x1 - x0) * (x1 - x2)
+                        d2 = (x2 - x0) * (x2 - x1)
+                        for t, out in ((x1 + h, fx_plus_h), (x1 - h, fx_minus_h)):
+                            out[1:-1] = (y0 * ((t - x1) * (t - x2)) / d0
+                                         + y1 * ((t - x0) * (t - x2)) / d1
+                                         + y2 * ((t - x0) * (t - x1)) / d2)
+                
+                if not (np.isfinite(fx_plus_h[:-1]).all() and np.isfinite(fx_minus_h[1:]).all()):
+                    raise ValueError("los valores de x deben ser distintos entre puntos vecinos")
+            
+            # Diferencias según la posición de cada punto
+            numerator = np.empty(n_points)
+            denominator = np.full(n_points, 2 * h)
+            if n_points == 1:
+                numerator[0] = fx_plus_h[0] - fx_minus_h[0]
+            else:
+                numerator[0] = fx_plus_h[0] - fx[0]
+                numerator[-1] = fx[-1] - fx_minus_h[-1]
+                numerator[1:-1] = fx_plus_h[1:-1] - fx_minus_h[1:-1]
+                denominator[0] = denominator[-1] = h
+            derivative = numerator / denominator
+            
+            # Construir los diccionarios de resultado a partir de los arreglos
+            results = []
+            for i, (xi, fi, fp, fm, num, den, d) in enumerate(zip(x.tolist(), fx.tolist(),
+                                                                  fx_plus_h.tolist(), fx_minus_h.tolist(),
+                                                                  numerator.tolist(), denominator.tolist(),
+                                                                  derivative.tolist())):
+                if n_points == 1 or 0 < i < n_points - 1:
+                    method = 'central'
+                    result = {
+                        'method': method, 'x': xi, 'h': h, 'fx': fi,
+                        'fx_plus_h': fp, 'fx_minus_h': fm,
+                        'numerator': num, 'denominator': den, 'derivative': d,
+                        'error_order': 'O(h²)',
+                        'formula': "f'(x) ≈ [f(x+h) - f(x-h)] / (2h)",
+                        'points_used': [xi - h, xi, xi + h],
+                        'function_values': [fm, fi, fp]
+                    }
+                elif i == 0:
+                    method = 'progressive'
+                    result = {
+                        'method': method, 'x': xi, 'h': h, 'fx': fi,
+                        'fx_plus_h': fp,
+                        'numerator': num, 'denominator': den, 'derivative': d,
+                        'error_order': 'O(h)',
+                        'formula': "f'(x) ≈ [f(x+h) - f(x)] / h",
+                        'points_used': [xi, xi + h],
+                        'function_values': [fi, fp]
+                    }
+                else:
+                    method = 'regressive'
+                    result = {
+                        'method': method, 'x': xi, 'h': h, 'fx': fi,
+                        'fx_minus_h': fm,
+                        'numerator': num, 'denominator': den, 'derivative': d,
+                        'error_order': 'O(h)',
+                        'formula': "f'(x) ≈ [f(x) - f(x-h)] / h",
+                        'points_used': [xi - h, xi],
+                        'function_values': [fm, fi]
+                    }
+                result['position_in_list'] = i
+                result['total_points'] = n_points
+                result['auto_selected_method'] = method
+                results.append(result)
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error en cálculo automático vectorizado: {e}")
+            raise ValueError(f"Error en auto_calculate_list_vec: {e}")
+    
     def calculate_single_point(self, x: float, h: float, f_func: callable, method: str) -> dict:
         """
         Cálculo para un punto específico con método seleccionado.
@@ -410,6 +410,14 @@ def create_function_from_string(expr: str) -> Callable[..., float]:
         "arcsin": np.arcsin, "arccos": np.arccos, "arctan": np.arctan
     }
 
+    # Compilar la expresión una sola vez; si no compila, eval reproduce el
+    # error original en cada llamada
+    processed_expr = expr.replace('^', '**').replace('sen', 'sin').replace('ln', 'log')
+    try:
+        code = compile(processed_expr, "<función>", "eval")
+    except SyntaxError:
+        code = processed_expr
+
     def safe_function(*args):
         # Preparar el namespace seguro
         namespace = allowed_names.copy()
@@ -423,9 +431,7 @@ def create_function_from_string(expr: str) -> Callable[..., float]:
             namespace["y"] = args[1]
 
         try:
-            # Reemplazar notaciones comunes
-            processed_expr = expr.replace('^', '**').replace('sen', 'sin').replace('ln', 'log')
-            return eval(processed_expr, {"__builtins__": {}}, namespace)
+            return eval(code, {"__builtins__": {}}, namespace)
         except Exception as e:
             raise ValueError(f"Error evaluando función '{expr}': {e}")
 
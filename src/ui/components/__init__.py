@@ -6,8 +6,8 @@ from .base_tab import BaseTab
 from .mixins import InputValidationMixin, ResultDisplayMixin, PlottingMixin
 from .constants import (
     VALIDATION, UI, PLOT, COLORS,
-    ERROR_MESSAGES, SUCCESS_MESSAGES,
-    DEFAULT_CONFIGS, ALLOWED_FUNCTIONS,
+    ERROR_MESSAGES, ERROR_MESSAGES_BY_VALUE, SUCCESS_MESSAGES,
+    DEFAULT_CONFIGS, get_default_config, ALLOWED_FUNCTIONS,
     ValidationErrorCodes, ErrorSeverity
 )
 from .error_handler import ErrorHandler, error_handler, handle_error, handle_validation_error, handle_success
@@ -32,8 +32,10 @@ __all__ = [
     'PLOT',
     'COLORS',
     'ERROR_MESSAGES',
+    'ERROR_MESSAGES_BY_VALUE',
     'SUCCESS_MESSAGES',
     'DEFAULT_CONFIGS',
+    'get_default_config',
     'ALLOWED_FUNCTIONS',
 
     # Enums
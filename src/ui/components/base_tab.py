@@ -368,10 +368,12 @@ class BaseTab(ctk.CTkFrame):
         for spine in ax.spines.values():
             spine.set_color('white')
         
-        # Leyenda si está habilitada
+        # Leyenda si está habilitada (solo si hay elementos con etiqueta,
+        # evita el UserWarning de matplotlib en gráficos sin leyenda)
         if PLOT_CONFIG["legend"]:
-            legend = ax.legend()
-            if legend:
+            handles, labels = ax.get_legend_handles_labels()
+            if labels:
+                legend = ax.legend(handles, labels)
                 legend.get_frame().set_facecolor('#2b2b2b')
                 legend.get_frame().set_edgecolor('white')
                 for text in legend.get_texts():
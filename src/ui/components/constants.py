@@ -5,12 +5,12 @@ Este módulo contiene todas las constantes y configuraciones por defecto
 usadas en la aplicación, siguiendo el principio DRY.
 """
 
-from typing import Dict, Any
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Final
 from enum import Enum
 
 
-class ValidationErrorCodes(Enum):
+class ValidationErrorCodes(str, Enum):
     """Códigos de error para validación"""
     EMPTY_FIELD = "EMPTY_FIELD"
     INVALID_NUMBER = "INVALID_NUMBER"
@@ -20,7 +20,7 @@ class ValidationErrorCodes(Enum):
     CONVERGENCE_FAILED = "CONVERGENCE_FAILED"
 
 
-class ErrorSeverity(Enum):
+class ErrorSeverity(str, Enum):
     """Niveles de severidad para errores"""
     INFO = "info"
     WARNING = "warning"
@@ -28,79 +28,75 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
 class ValidationConstants:
     """Constantes para validación de entrada"""
-    MAX_ITERATIONS: int = 1000
-    MIN_ITERATIONS: int = 1
-    DEFAULT_TOLERANCE: float = 1e-6
-    MIN_TOLERANCE: float = 1e-15
-    MAX_TOLERANCE: float = 1e-1
-    DEFAULT_STEP_SIZE: float = 0.1
-    MIN_STEP_SIZE: float = 1e-10
-    MAX_STEP_SIZE: float = 1.0
-    MAX_SUBDIVISIONS: int = 10000
-    MIN_SUBDIVISIONS: int = 2
-    MIN_POINTS: int = 2  # Número mínimo de puntos para diferencias finitas
-    MAX_VALUE: float = 1e10  # Valor máximo absoluto para límites
-    MIN_VALUE: float = -1e10  # Valor mínimo absoluto para límites
-    MAX_X_VALUE: float = 1e10  # Valor máximo para coordenada X
-    MIN_X_VALUE: float = -1e10  # Valor mínimo para coordenada X
-    MAX_Y_VALUE: float = 1e10  # Valor máximo para coordenada Y
-    MIN_Y_VALUE: float = -1e10  # Valor mínimo para coordenada Y
-    MAX_INTERVAL: float = 1e6  # Intervalo máximo entre a y b
-    MIN_INTERVAL: float = 1e-6  # Intervalo mínimo entre a y b
-
-
-@dataclass
+    MAX_ITERATIONS: Final[int] = 1000
+    MIN_ITERATIONS: Final[int] = 1
+    DEFAULT_TOLERANCE: Final[float] = 1e-6
+    MIN_TOLERANCE: Final[float] = 1e-15
+    MAX_TOLERANCE: Final[float] = 1e-1
+    DEFAULT_STEP_SIZE: Final[float] = 0.1
+    MIN_STEP_SIZE: Final[float] = 1e-10
+    MAX_STEP_SIZE: Final[float] = 1.0
+    MAX_SUBDIVISIONS: Final[int] = 10000
+    MIN_SUBDIVISIONS: Final[int] = 2
+    MIN_POINTS: Final[int] = 2  # Número mínimo de puntos para diferencias finitas
+    MAX_VALUE: Final[float] = 1e10  # Valor máximo absoluto para límites
+    MIN_VALUE: Final[float] = -1e10  # Valor mínimo absoluto para límites
+    MAX_X_VALUE: Final[float] = 1e10  # Valor máximo para coordenada X
+    MIN_X_VALUE: Final[float] = -1e10  # Valor mínimo para coordenada X
+    MAX_Y_VALUE: Final[float] = 1e10  # Valor máximo para coordenada Y
+    MIN_Y_VALUE: Final[float] = -1e10  # Valor mínimo para coordenada Y
+    MAX_INTERVAL: Final[float] = 1e6  # Intervalo máximo entre a y b
+    MIN_INTERVAL: Final[float] = 1e-6  # Intervalo mínimo entre a y b
+
+
 class UIConstants:
     """Constantes para la interfaz de usuario"""
-    WINDOW_WIDTH: int = 1400
-    WINDOW_HEIGHT: int = 900
-    MIN_WINDOW_WIDTH: int = 1200
-    MIN_WINDOW_HEIGHT: int = 800
-    DEFAULT_FONT_SIZE: int = 12
-    TITLE_FONT_SIZE: int = 20
-    BUTTON_HEIGHT: int = 35
-    ENTRY_HEIGHT: int = 30
-    TEXTBOX_HEIGHT: int = 200
-    SCROLLABLE_FRAME_HEIGHT: int = 600
-
-
-@dataclass
+    WINDOW_WIDTH: Final[int] = 1400
+    WINDOW_HEIGHT: Final[int] = 900
+    MIN_WINDOW_WIDTH: Final[int] = 1200
+    MIN_WINDOW_HEIGHT: Final[int] = 800
+    DEFAULT_FONT_SIZE: Final[int] = 12
+    TITLE_FONT_SIZE: Final[int] = 20
+    BUTTON_HEIGHT: Final[int] = 35
+    ENTRY_HEIGHT: Final[int] = 30
+    TEXTBOX_HEIGHT: Final[int] = 200
+    SCROLLABLE_FRAME_HEIGHT: Final[int] = 600
+
+
 class PlotConstants:
     """Constantes para gráficos"""
-    FIGURE_WIDTH: int = 10
-    FIGURE_HEIGHT: int = 6
-    FIGSIZE: tuple = (10, 6)
-    DPI: int = 100
-    BGCOLOR: str = "#f0f0f0"
-    LINE_WIDTH: float = 2.0
-    MARKER_SIZE: float = 6.0
-    GRID_ALPHA: float = 0.3
-    LEGEND_FONTSIZE: int = 10
-
-
-@dataclass
+    FIGURE_WIDTH: Final[int] = 10
+    FIGURE_HEIGHT: Final[int] = 6
+    FIGSIZE: Final[tuple] = (10, 6)
+    DPI: Final[int] = 100
+    BGCOLOR: Final[str] = "#f0f0f0"
+    LINE_WIDTH: Final[float] = 2.0
+    MARKER_SIZE: Final[float] = 6.0
+    GRID_ALPHA: Final[float] = 0.3
+    LEGEND_FONTSIZE: Final[int] = 10
+
+
 class ColorConstants:
     """Constantes de colores para la interfaz"""
-    PRIMARY: str = "#1f538d"
-    PRIMARY_HOVER: str = "#3d8bff"
-    SECONDARY: str = "#2b2b2b"
-    SECONDARY_HOVER: str = "#404040"
-    SUCCESS: str = "#28a745"
-    WARNING: str = "#ffc107"
-    ERROR: str = "#dc3545"
-    INFO: str = "#17a2b8"
-    TEXT_LIGHT: str = "#ffffff"
-    TEXT_DARK: str = "#000000"
-
-
-# Instancias de constantes
-VALIDATION = ValidationConstants()
-UI = UIConstants()
-PLOT = PlotConstants()
-COLORS = ColorConstants()
+    PRIMARY: Final[str] = "#1f538d"
+    PRIMARY_HOVER: Final[str] = "#3d8bff"
+    SECONDARY: Final[str] = "#2b2b2b"
+    SECONDARY_HOVER: Final[str] = "#404040"
+    SUCCESS: Final[str] = "#28a745"
+    WARNING: Final[str] = "#ffc107"
+    ERROR: Final[str] = "#dc3545"
+    INFO: Final[str] = "#17a2b8"
+    TEXT_LIGHT: Final[str] = "#ffffff"
+    TEXT_DARK: Final[str] = "#000000"
+
+
+# Accesos a las constantes (atributos de clase, sin instancia intermedia)
+VALIDATION = ValidationConstants
+UI = UIConstants
+PLOT = PlotConstants
+COLORS = ColorConstants
 
 # Mensajes de error amigables
 ERROR_MESSAGES = {
@@ -112,6 +108,9 @@ ERROR_MESSAGES = {
     ValidationErrorCodes.CONVERGENCE_FAILED: "El método no convergió en el número máximo de iteraciones. Intente con diferentes parámetros.",
 }
 
+# Mensajes de error indexados por el valor crudo del código (evita hashear el Enum)
+ERROR_MESSAGES_BY_VALUE = {code.value: message for code, message in ERROR_MESSAGES.items()}
+
 # Mensajes de éxito
 SUCCESS_MESSAGES = {
     "CALCULATION_SUCCESS": "Cálculo completado exitosamente.",
@@ -119,8 +118,8 @@ SUCCESS_MESSAGES = {
     "PLOT_SUCCESS": "Gráfico generado correctamente.",
 }
 
-# Configuraciones por defecto para diferentes métodos
-DEFAULT_CONFIGS = {
+# Configuraciones por defecto para diferentes métodos (vistas inmutables compartidas)
+DEFAULT_CONFIGS = {name: MappingProxyType(config) for name, config in {
     "root_finding": {
         "tolerance": VALIDATION.DEFAULT_TOLERANCE,
         "max_iterations": VALIDATION.MAX_ITERATIONS,
@@ -141,7 +140,12 @@ DEFAULT_CONFIGS = {
         "step_size": VALIDATION.DEFAULT_STEP_SIZE,
         "method": "central"
     }
-}
+}.items()}
+
+
+def get_default_config(name: str) -> Dict[str, Any]:
+    """Devuelve una copia mutable de la configuración por defecto indicada"""
+    return dict(DEFAULT_CONFIGS[name])
 
 # Funciones matemáticas permitidas
 ALLOWED_FUNCTIONS = {
@@ -159,7 +163,14 @@ ALLOWED_FUNCTIONS = {
 }
 
 # Caracteres permitidos en expresiones
-ALLOWED_CHARS = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.,()[]{}+-*/^=<>!&| ")
+ALLOWED_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.,()[]{}+-*/^=<>!&| ")
+
+def is_valid_expr(expr: str) -> bool:
+    """
+    Verifica que la expresión solo contenga caracteres permitidos.
+    """
+    return ALLOWED_CHARS.issuperset(expr)
+
 
 # Configuración de logging
 LOGGING_CONFIG = {
@@ -5,15 +5,55 @@ Este módulo proporciona un sistema unificado para manejar errores,
 mostrar mensajes amigables al usuario y gestionar recuperación de errores.
 """
 
-import customtkinter as ctk
 import logging
-from typing import Optional, Callable, Any
+import re
+from typing import TYPE_CHECKING, Optional, Callable, Any
 from enum import Enum
 
-from .constants import ERROR_MESSAGES, SUCCESS_MESSAGES, ErrorSeverity, ValidationErrorCodes, COLORS
+from .constants import ERROR_MESSAGES_BY_VALUE, SUCCESS_MESSAGES, ErrorSeverity, ValidationErrorCodes, COLORS
+
+if TYPE_CHECKING:
+    import customtkinter as ctk
 
 logger = logging.getLogger(__name__)
 
+# Mapeo de errores técnicos a mensajes amigables
+_ERROR_MAPPINGS = {
+    "division by zero": "Se intentó dividir por cero. Verifique los parámetros.",
+    "math domain error": "Error matemático: verifique que la función esté definida en el dominio.",
+    "invalid syntax": "La expresión matemática contiene errores de sintaxis.",
+    "nameerror": "Variable o función no reconocida en la expresión.",
+    "overflow": "Los valores son demasiado grandes para calcularse con precisión.",
+    "underflow": "Los valores son demasiado pequeños para calcularse con precisión.",
+    "convergence": "El método no pudo converger con los parámetros dados.",
+    "max iterations": "Se alcanzó el número máximo de iteraciones sin convergencia.",
+}
+
+# Patrón único compilado una vez: una sola pasada sobre el mensaje en lugar de N búsquedas.
+# El lookahead reporta el término en cada posición aunque se solapen, y la
+# prioridad (orden en _ERROR_MAPPINGS) decide entre varios encontrados.
+_ERROR_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(term) for term in _ERROR_MAPPINGS) + "))",
+    re.IGNORECASE
+)
+_ERROR_LOOKUP = {term.lower(): message for term, message in _ERROR_MAPPINGS.items()}
+_ERROR_PRIORITY = {term.lower(): i for i, term in enumerate(_ERROR_MAPPINGS)}
+
+# Títulos y colores según severidad
+_SEVERITY_TITLES = {
+    ErrorSeverity.INFO: "Información",
+    ErrorSeverity.WARNING: "Advertencia",
+    ErrorSeverity.ERROR: "Error",
+    ErrorSeverity.CRITICAL: "Error Crítico"
+}
+
+_SEVERITY_COLORS = {
+    ErrorSeverity.INFO: COLORS.INFO,
+    ErrorSeverity.WARNING: COLORS.WARNING,
+    ErrorSeverity.ERROR: COLORS.ERROR,
+    ErrorSeverity.CRITICAL: COLORS.ERROR
+}
+
 
 class ErrorHandler:
     """
@@ -21,7 +61,12 @@ class ErrorHandler:
     Implementa el patrón Singleton para consistencia global.
     """
 
+    __slots__ = ("_error_callbacks", "_success_callbacks",
+                 "_dialog", "_dialog_label", "_dialog_button")
+
     _instance = None
+    _initialized = False
+    _cached_font = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -29,18 +74,30 @@ class ErrorHandler:
         return cls._instance
 
     def __init__(self):
-        if not hasattr(self, '_initialized'):
-            self._initialized = True
-            self._error_callbacks = []
-            self._success_callbacks = []
+        # Python invoca __init__ en cada ErrorHandler(); solo se inicializa una vez
+        cls = type(self)
+        if cls._initialized:
+            return
+        cls._initialized = True
+
+        # Tuplas: el registro es raro y la iteración sobre tuplas es más barata
+        self._error_callbacks = ()
+        self._success_callbacks = ()
+        self._dialog = None
+        self._dialog_label = None
+        self._dialog_button = None
 
     def register_error_callback(self, callback: Callable[[str, ErrorSeverity], None]):
         """Registra un callback para manejar errores"""
-        self._error_callbacks.append(callback)
+        if not callable(callback):
+            raise TypeError(f"El callback de error debe ser invocable: {callback!r}")
+        self._error_callbacks += (callback,)
 
     def register_success_callback(self, callback: Callable[[str], None]):
         """Registra un callback para manejar mensajes de éxito"""
-        self._success_callbacks.append(callback)
+        if not callable(callback):
+            raise TypeError(f"El callback de éxito debe ser invocable: {callback!r}")
+        self._success_callbacks += (callback,)
 
     def handle_error(self, error: Exception, context: str = "",
                     severity: ErrorSeverity = ErrorSeverity.ERROR,
@@ -54,16 +111,22 @@ class ErrorHandler:
             severity: Severidad del error
             show_dialog: Si mostrar diálogo al usuario
         """
+        # Se convierte la excepción a texto una sola vez
+        error_str = str(error)
+
         # Log del error técnico
-        logger.error(f"Error en {context}: {str(error)}", exc_info=True)
+        logger.error("Error en %s: %s", context, error_str, exc_info=True)
 
         # Convertir a mensaje amigable
-        user_message = self._convert_to_user_message(error, context)
+        user_message = self._convert_to_user_message(error_str, context)
 
         # Notificar callbacks
-        for callback in self._error_callbacks:
+        callbacks = self._error_callbacks
+        if callbacks:
+            # Callbacks validados al registrarse: un único try fuera del bucle
             try:
-                callback(user_message, severity)
+                for callback in callbacks:
+                    callback(user_message, severity)
             except Exception as e:
                 logger.error(f"Error en callback: {e}")
 
@@ -84,7 +147,8 @@ class ErrorHandler:
         Returns:
             Mensaje de error para el usuario
         """
-        user_message = ERROR_MESSAGES.get(error_code, "Error de validación desconocido")
+        code_value = error_code.value if isinstance(error_code, ValidationErrorCodes) else error_code
+        user_message = ERROR_MESSAGES_BY_VALUE.get(code_value, "Error de validación desconocido")
 
         if field_name:
             user_message = f"Campo '{field_name}': {user_message}"
@@ -107,36 +171,25 @@ class ErrorHandler:
         message = custom_message or SUCCESS_MESSAGES.get(message_key, "Operación exitosa")
 
         # Notificar callbacks
-        for callback in self._success_callbacks:
+        callbacks = self._success_callbacks
+        if callbacks:
             try:
-                callback(message)
+                for callback in callbacks:
+                    callback(message)
             except Exception as e:
                 logger.error(f"Error en callback de éxito: {e}")
 
         if show_dialog:
             self._show_success_dialog(message)
 
-    def _convert_to_user_message(self, error: Exception, context: str) -> str:
+    def _convert_to_user_message(self, error_str: str, context: str) -> str:
         """
-        Convierte excepciones técnicas en mensajes amigables para el usuario.
+        Convierte el texto de excepciones técnicas en mensajes amigables para el usuario.
         """
-        error_str = str(error).lower()
-
-        # Mapeo de errores técnicos a mensajes amigables
-        error_mappings = {
-            "division by zero": "Se intentó dividir por cero. Verifique los parámetros.",
-            "math domain error": "Error matemático: verifique que la función esté definida en el dominio.",
-            "invalid syntax": "La expresión matemática contiene errores de sintaxis.",
-            "nameerror": "Variable o función no reconocida en la expresión.",
-            "overflow": "Los valores son demasiado grandes para calcularse con precisión.",
-            "underflow": "Los valores son demasiado pequeños para calcularse con precisión.",
-            "convergence": "El método no pudo converger con los parámetros dados.",
-            "max iterations": "Se alcanzó el número máximo de iteraciones sin convergencia.",
-        }
-
-        for technical_term, user_message in error_mappings.items():
-            if technical_term in error_str:
-                return user_message
+        matches = _ERROR_PATTERN.findall(error_str)
+        if matches:
+            term = min((m.lower() for m in matches), key=_ERROR_PRIORITY.__getitem__)
+            return _ERROR_LOOKUP[term]
 
         # Mensaje genérico si no hay mapeo específico
         context_msg = f" en {context}" if context else ""
@@ -146,105 +199,106 @@ class ErrorHandler:
         """
         Muestra un diálogo de error con el mensaje apropiado.
         """
-        # Crear ventana de error
-        error_window = ctk.CTkToplevel()
-        error_window.title(self._get_severity_title(severity))
-        error_window.geometry("500x200")
-        error_window.grab_set()
-
         # Configurar colores según severidad
         color = self._get_severity_color(severity)
 
-        # Mensaje de error
-        error_label = ctk.CTkLabel(
-            error_window,
-            text=message,
+        self._show_dialog(
+            title=self._get_severity_title(severity),
+            geometry="500x200",
+            message=message,
             wraplength=450,
-            font=ctk.CTkFont(size=12),
-            text_color=color
-        )
-        error_label.pack(pady=20, padx=20)
-
-        # Botón de cerrar
-        close_btn = ctk.CTkButton(
-            error_window,
-            text="Entendido",
-            command=error_window.destroy,
-            fg_color=color
+            color=color,
+            button_text="Entendido"
         )
-        close_btn.pack(pady=10)
 
     def _show_success_dialog(self, message: str) -> None:
         """
         Muestra un diálogo de éxito.
         """
-        success_window = ctk.CTkToplevel()
-        success_window.title("Éxito")
-        success_window.geometry("400x150")
-        success_window.grab_set()
-
-        success_label = ctk.CTkLabel(
-            success_window,
-            text=message,
+        self._show_dialog(
+            title="Éxito",
+            geometry="400x150",
+            message=message,
             wraplength=350,
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS.SUCCESS
+            color=COLORS.SUCCESS,
+            button_text="OK"
         )
-        success_label.pack(pady=20, padx=20)
 
-        close_btn = ctk.CTkButton(
-            success_window,
-            text="OK",
-            command=success_window.destroy,
-            fg_color=COLORS.SUCCESS
+    def _show_dialog(self, title: str, geometry: str, message: str,
+                     wraplength: int, color: str, button_text: str) -> None:
+        """
+        Muestra el diálogo modal reutilizable.
+        La ventana se crea una sola vez y luego solo se actualiza su
+        contenido, evitando reconstruir widgets Tk en cada mensaje.
+        """
+        dialog = self._get_dialog()
+        dialog.title(title)
+        dialog.geometry(geometry)
+
+        self._dialog_label.configure(text=message, wraplength=wraplength, text_color=color)
+        self._dialog_button.configure(text=button_text, fg_color=color)
+
+        dialog.deiconify()
+        dialog.grab_set()
+
+    def _get_dialog(self) -> "ctk.CTkToplevel":
+        """Obtiene el diálogo oculto, creándolo si aún no existe"""
+        dialog = self._dialog
+        if dialog is not None and dialog.winfo_exists():
+            return dialog
+
+        # Import diferido: los usos sin diálogo no cargan customtkinter
+        import customtkinter as ctk
+
+        dialog = ctk.CTkToplevel()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_dialog)
+
+        self._dialog_label = ctk.CTkLabel(
+            dialog,
+            text="",
+            font=self._default_font()
         )
-        close_btn.pack(pady=10)
+        self._dialog_label.pack(pady=20, padx=20)
+
+        self._dialog_button = ctk.CTkButton(
+            dialog,
+            text="",
+            command=self._hide_dialog
+        )
+        self._dialog_button.pack(pady=10)
+
+        self._dialog = dialog
+        return dialog
+
+    @classmethod
+    def _default_font(cls) -> "ctk.CTkFont":
+        """Obtiene la fuente de los diálogos, creándola una sola vez"""
+        font = cls._cached_font
+        if font is None:
+            import customtkinter as ctk
+            font = ctk.CTkFont(size=12)
+            cls._cached_font = font
+        return font
+
+    def _hide_dialog(self) -> None:
+        """Oculta el diálogo en lugar de destruirlo para poder reutilizarlo"""
+        if self._dialog is not None:
+            self._dialog.grab_release()
+            self._dialog.withdraw()
 
     def _get_severity_title(self, severity: ErrorSeverity) -> str:
         """Obtiene el título apropiado según la severidad"""
-        titles = {
-            ErrorSeverity.INFO: "Información",
-            ErrorSeverity.WARNING: "Advertencia",
-            ErrorSeverity.ERROR: "Error",
-            ErrorSeverity.CRITICAL: "Error Crítico"
-        }
-        return titles.get(severity, "Mensaje")
+        return _SEVERITY_TITLES.get(severity, "Mensaje")
 
     def _get_severity_color(self, severity: ErrorSeverity) -> str:
         """Obtiene el color apropiado según la severidad"""
-        colors = {
-            ErrorSeverity.INFO: COLORS.INFO,
-            ErrorSeverity.WARNING: COLORS.WARNING,
-            ErrorSeverity.ERROR: COLORS.ERROR,
-            ErrorSeverity.CRITICAL: COLORS.ERROR
-        }
-        return colors.get(severity, COLORS.ERROR)
+        return _SEVERITY_COLORS.get(severity, COLORS.ERROR)
 
 
 # Instancia global del gestor de errores
 error_handler = ErrorHandler()
 
-
-def handle_error(error: Exception, context: str = "",
-                severity: ErrorSeverity = ErrorSeverity.ERROR,
-                show_dialog: bool = True) -> None:
-    """
-    Función de conveniencia para manejar errores globalmente.
-    """
-    error_handler.handle_error(error, context, severity, show_dialog)
-
-
-def handle_validation_error(error_code: ValidationErrorCodes,
-                           field_name: str = "", show_dialog: bool = True) -> str:
-    """
-    Función de conveniencia para manejar errores de validación.
-    """
-    return error_handler.handle_validation_error(error_code, field_name, show_dialog)
-
-
-def handle_success(message_key: str, custom_message: str = "",
-                  show_dialog: bool = False) -> None:
-    """
-    Función de conveniencia para manejar mensajes de éxito.
-    """
-    error_handler.handle_success(message_key, custom_message, show_dialog)
+# Funciones de conveniencia para uso global (métodos ligados: sin marco de llamada extra)
+handle_error = error_handler.handle_error
+handle_validation_error = error_handler.handle_validation_error
+handle_success = error_handler.handle_success
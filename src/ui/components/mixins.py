@@ -5,15 +5,121 @@ Implementa el patrón Mixin siguiendo principios SOLID y DRY.
 Permite composición de funcionalidades sin herencia múltiple compleja.
 """
 
+import ast
+import math
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable
+import tkinter as tk
+from tkinter import ttk
 import customtkinter as ctk
 from customtkinter import CTkScrollableFrame
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 
 from src.ui.components.base_tab import BaseTab
 from config.settings import PLOT_CONFIG
 from .constants import PLOT
+from .error_handler import handle_error
+from src.core.root_finding import create_function_from_string
+
+# Filas del Treeview de iteraciones que se insertan por cada carga perezosa
+TABLE_ROWS_CHUNK = 25
+
+# A partir de esta cantidad de iteraciones el formateo se hace en un hilo de trabajo
+PREPARE_ROWS_THREAD_MIN = 500
+
+# Separadores precalculados para subrayar títulos (se recortan con slicing)
+_EQ = "=" * 256
+_DASH = "-" * 256
+
+# Nombres permitidos en funciones ingresadas por el usuario
+# (los mismos que entiende create_function_from_string, más sus alias)
+_ALLOWED_FUNCTION_NAMES = frozenset({
+    "x", "t", "y", "pi", "e",
+    "sin", "cos", "tan", "exp", "log", "log10", "sqrt", "abs",
+    "sinh", "cosh", "tanh", "arcsin", "arccos", "arctan",
+    "sen", "ln",
+})
+
+# Nodos del árbol sintáctico admitidos en una expresión matemática
+_ALLOWED_FUNCTION_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name,
+    ast.Constant, ast.Load, ast.operator, ast.unaryop,
+)
+
+# Estilo estándar de gráficos (resuelto una sola vez al importar)
+_PLOT_BG = '#2b2b2b'
+_GRID_ENABLED = PLOT_CONFIG["grid"]
+_LEGEND_ENABLED = PLOT_CONFIG["legend"]
+_TITLE_STYLE = dict(color='white', fontsize=14, fontweight='bold')
+_LABEL_STYLE = dict(color='white', fontsize=12)
+_GRID_STYLE = dict(alpha=0.3)
+_TICK_STYLE = dict(labelsize=10)
+_ANNOTATION_STYLE = dict(xytext=(10, 10), textcoords='offset points', color='white', fontsize=10)
+_ANNOTATION_BBOX = dict(boxstyle='round,pad=0.3', facecolor=_PLOT_BG, alpha=0.8)
+
+# Columnas de la tabla de iteraciones por método: (headers, claves de cada iteración).
+# La última clave siempre es el error.
+ITERATION_TABLE_LAYOUTS = {
+    "BISECCIÓN": (("Iter", "a", "b", "c", "f(c)", "Error"),
+                  ("a", "b", "c", "f_c", "error")),
+    "NEWTON-RAPHSON": (("Iter", "xₙ", "f(xₙ)", "f'(xₙ)", "xₙ₊₁", "Error"),
+                       ("x_n", "f_x_n", "df_x_n", "x_n_plus_1", "error")),
+    "PUNTO FIJO": (("Iter", "xₙ", "g(xₙ)", "Error"),
+                   ("x_n", "g_x_n", "error")),
+    "AITKEN": (("Iter", "x", "x₁", "x₂", "x_aitken", "Error"),
+               ("x", "x1", "x2", "x_aitken", "error")),
+    "SECANTE": (("Iter", "xₙ₋₁", "xₙ", "xₙ₊₁", "f(xₙ₋₁)", "f(xₙ)", "Error"),
+                ("x_prev", "x_curr", "x_new", "f_prev", "f_curr", "error")),
+}
+
+ITERATION_METHOD_DESCRIPTIONS = {
+    "BISECCIÓN": "Método de búsqueda de raíces que divide el intervalo repetidamente",
+    "NEWTON-RAPHSON": "Método iterativo que utiliza la derivada para aproximar raíces",
+    "PUNTO FIJO": "Método que convierte f(x)=0 a x=g(x) y resuelve iterativamente",
+    "AITKEN": "Método de aceleración que mejora la convergencia de punto fijo",
+    "SECANTE": "Método que aproxima la derivada con dos puntos consecutivos",
+}
+
+
+@lru_cache(maxsize=128)
+def check_function_syntax(function_str: str) -> Optional[str]:
+    """
+    Valida una expresión recorriendo su árbol sintáctico con una lista blanca.
+
+    Returns:
+        None si la expresión es válida, o el mensaje de error
+    """
+    try:
+        tree = ast.parse(function_str, mode='eval')
+    except SyntaxError:
+        return "Sintaxis inválida en la función"
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_FUNCTION_NODES):
+            return f"Elemento no permitido en la función: {type(node).__name__}"
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_FUNCTION_NAMES:
+            return f"Nombre no permitido en la función: {node.id}"
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.keywords):
+            return "Llamada no permitida en la función"
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            return f"Valor no permitido en la función: {node.value!r}"
+    return None
+
+
+def resolve_iteration_method(method_name: str) -> Optional[str]:
+    """
+    Obtiene la clave de ITERATION_TABLE_LAYOUTS que corresponde al nombre del método.
+    Acepta nombres como "MÉTODO DE BISECCIÓN" o "Bisección".
+    """
+    upper_name = method_name.upper()
+    for method_key in ITERATION_TABLE_LAYOUTS:
+        if method_key in upper_name:
+            return method_key
+    return None
 
 
 def format_decimal_number(value, decimal_places=8):
@@ -37,6 +143,53 @@ def format_decimal_number(value, decimal_places=8):
         return f"{value:.{decimal_places + 4}f}"
 
 
+def is_columnar_iteration_data(iteration_data) -> bool:
+    """
+    Indica si los datos de iteración vienen por columnas (dict de arrays NumPy)
+    en lugar de una lista de diccionarios por fila.
+    """
+    return (isinstance(iteration_data, dict) and bool(iteration_data)
+            and all(isinstance(column, np.ndarray) for column in iteration_data.values()))
+
+
+def format_iteration_matrix(iteration_data, keys) -> list:
+    """
+    Formatea en una sola pasada vectorizada los valores de una tabla de iteraciones.
+
+    Args:
+        iteration_data: Lista de diccionarios (una fila por iteración) o
+            diccionario de columnas NumPy
+        keys: Claves a extraer; la última se formatea como error
+
+    Returns:
+        Lista de filas con los valores formateados como strings
+    """
+    if is_columnar_iteration_data(iteration_data):
+        # Columnas contiguas: no hace falta recorrer filas en Python
+        n_rows = len(next(iter(iteration_data.values())))
+        matrix = np.column_stack([
+            np.asarray(iteration_data[key], dtype=np.float64) if key in iteration_data
+            else np.zeros(n_rows)
+            for key in keys
+        ]).reshape(n_rows, len(keys))
+    else:
+        matrix = np.array([[data.get(key, 0) for key in keys] for data in iteration_data],
+                          dtype=np.float64).reshape(len(iteration_data), len(keys))
+
+    # Mismo formato que format_decimal_number(value, 8) para la columna de error
+    errors = matrix[:, -1]
+    abs_errors = np.abs(errors)
+    error_text = np.where(
+        abs_errors == 0,
+        "0.00000000",
+        np.where(abs_errors >= 0.0001,
+                 np.char.mod("%.8f", errors),
+                 np.char.mod("%.12f", errors))
+    )
+
+    return np.column_stack((np.char.mod("%.6f", matrix[:, :-1]), error_text)).tolist()
+
+
 class InputValidationMixin:
     """
     Mixin para validación de entradas de usuario.
@@ -64,14 +217,21 @@ class InputValidationMixin:
             if not value_str:
                 return False, {}, f"El campo '{field_name}' no puede estar vacío"
 
+            # Un solo intento de conversión; solo los valores enteros revisan el texto
+            # para decidir si se devuelven como int
             try:
-                if '.' in value_str or 'e' in value_str.lower():
-                    values[field_name] = float(value_str)
-                else:
-                    values[field_name] = int(value_str)
+                value = float(value_str)
             except ValueError:
                 return False, {}, f"El campo '{field_name}' debe ser un número válido"
 
+            if not math.isfinite(value):
+                return False, {}, f"El campo '{field_name}' debe ser un número válido"
+
+            if value.is_integer() and '.' not in value_str and 'e' not in value_str and 'E' not in value_str:
+                values[field_name] = int(value_str)
+            else:
+                values[field_name] = value
+
         return True, values, ""
 
     def validate_function_input(self, entries: Dict[str, ctk.CTkEntry],
@@ -91,14 +251,22 @@ class InputValidationMixin:
         if not function_str:
             return False, "", "La función no puede estar vacía"
 
-        # Validación básica de sintaxis
-        invalid_chars = [';', 'exec', 'eval', '__']
-        for char in invalid_chars:
-            if char in function_str.lower():
-                return False, "", f"Caracteres no permitidos en la función: {char}"
+        # Validación de sintaxis con lista blanca (resultado cacheado por texto)
+        error = check_function_syntax(function_str)
+        if error:
+            return False, "", error
 
         return True, function_str, ""
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _compile_expr(expr: str) -> Callable:
+        """
+        Devuelve la función compilada para la expresión dada.
+        Se reutiliza mientras el texto de la función no cambie.
+        """
+        return create_function_from_string(expr)
+
 
 class ResultDisplayMixin:
     """
@@ -106,6 +274,21 @@ class ResultDisplayMixin:
     Principio de responsabilidad única: solo presentación de resultados.
     """
 
+    _iteration_tree_style_ready = False
+    _cached_fonts: Dict[tuple, ctk.CTkFont] = {}
+
+    @classmethod
+    def _get_font(cls, size: int, weight: str = "normal", slant: str = "roman") -> ctk.CTkFont:
+        """
+        Obtiene una fuente compartida, creándola solo la primera vez que se pide.
+        """
+        key = (size, weight, slant)
+        font = cls._cached_fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight, slant=slant)
+            cls._cached_fonts[key] = font
+        return font
+
     def display_calculation_results(self, results_text_widget: ctk.CTkTextbox,
                                    title: str, main_data: Dict[str, Any],
                                    sections: Optional[Dict[str, Any]] = None) -> None:
@@ -113,30 +296,29 @@ class ResultDisplayMixin:
         Muestra resultados de cálculo de forma estandarizada.
         Principio DRY: formato consistente en todas las pestañas.
         """
-        text = f"{title}\n"
-        text += "=" * len(title) + "\n\n"
+        parts = [f"{title}\n", _EQ[:len(title)], "\n\n"]
 
         # Datos principales
         for key, value in main_data.items():
             if isinstance(value, (int, float)):
-                text += f"{key}: {format_decimal_number(value, 8)}\n"
+                parts.append(f"{key}: {format_decimal_number(value, 8)}\n")
             else:
-                text += f"{key}: {value}\n"
+                parts.append(f"{key}: {value}\n")
 
         # Secciones adicionales
         if sections:
             for section_name, section_data in sections.items():
-                text += f"\n{section_name}:\n"
-                text += "-" * len(section_name) + "\n"
+                parts.append(f"\n{section_name}:\n")
+                parts.append(_DASH[:len(section_name)] + "\n")
 
                 if isinstance(section_data, dict):
-                    for key, value in section_data.items():
-                        text += f"{key}: {value}\n"
+                    parts.extend(f"{key}: {value}\n" for key, value in section_data.items())
                 elif isinstance(section_data, (list, tuple)):
-                    for item in section_data:
-                        text += f"• {item}\n"
+                    parts.extend(f"• {item}\n" for item in section_data)
                 else:
-                    text += f"{section_data}\n"
+                    parts.append(f"{section_data}\n")
+
+        text = "".join(parts)
 
         # Limpiar y mostrar
         results_text_widget.delete("0.0", "end")
@@ -146,24 +328,37 @@ class ResultDisplayMixin:
         """
         Muestra tabla de iteraciones en un popup movible y cerrable.
         Implementa una interfaz moderna y legible.
+        Acepta una lista de diccionarios o un diccionario de columnas NumPy.
         """
         # Verificar si hay datos de iteración
         if not iteration_data:
             return
             
-        # Convertir a lista si es un solo diccionario
-        if isinstance(iteration_data, dict):
+        # Convertir a lista si es un solo diccionario (salvo datos por columnas)
+        columnar = is_columnar_iteration_data(iteration_data)
+        if isinstance(iteration_data, dict) and not columnar:
             iteration_data = [iteration_data]
+        n_iterations = len(next(iter(iteration_data.values()))) if columnar else len(iteration_data)
             
-        # Crear ventana popup
-        popup = ctk.CTkToplevel(parent_widget)
+        # Reutilizar la ventana popup de este padre si sigue existiendo
+        if not hasattr(self, '_iteration_popups'):
+            self._iteration_popups = {}
+
+        popup = self._iteration_popups.get(id(parent_widget))
+        reused = popup is not None and popup.winfo_exists()
+        if reused:
+            # Descartar el contenido anterior manteniendo la ventana
+            popup.withdraw()
+            for child in popup.winfo_children():
+                child.destroy()
+        else:
+            popup = ctk.CTkToplevel(parent_widget)
+            # Construir oculta para evitar relayouts/redibujos mientras se llena la tabla
+            popup.withdraw()
+            popup.resizable(True, True)
+            popup.protocol("WM_DELETE_WINDOW", lambda: self._hide_iteration_popup(popup))
+            self._iteration_popups[id(parent_widget)] = popup
         popup.title(f"Tabla de Iteraciones - {method_name}")
-        popup.geometry("900x650")
-        popup.resizable(True, True)
-        
-        # Hacer que sea modal pero movible
-        popup.transient(parent_widget)
-        popup.grab_set()
         
         # Frame principal
         main_frame = ctk.CTkFrame(popup)
@@ -173,28 +368,18 @@ class ResultDisplayMixin:
         title_label = ctk.CTkLabel(
             main_frame,
             text=f"Tabla de Iteraciones - {method_name}",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self._get_font(18, weight="bold")
         )
         title_label.pack(pady=(15, 10))
         
         # Descripción del método
-        description = ""
-        if method_name.upper().startswith("BISECCIÓN"):
-            description = "Método de búsqueda de raíces que divide el intervalo repetidamente"
-        elif method_name.upper().startswith("NEWTON-RAPHSON"):
-            description = "Método iterativo que utiliza la derivada para aproximar raíces"
-        elif method_name.upper().startswith("PUNTO FIJO"):
-            description = "Método que convierte f(x)=0 a x=g(x) y resuelve iterativamente"
-        elif method_name.upper().startswith("AITKEN"):
-            description = "Método de aceleración que mejora la convergencia de punto fijo"
-        elif method_name.upper().startswith("SECANTE"):
-            description = "Método que aproxima la derivada con dos puntos consecutivos"
+        description = ITERATION_METHOD_DESCRIPTIONS.get(resolve_iteration_method(method_name), "")
             
         if description:
             desc_label = ctk.CTkLabel(
                 main_frame,
                 text=description,
-                font=ctk.CTkFont(size=13)
+                font=self._get_font(13)
             )
             desc_label.pack(pady=(0, 15))
         
@@ -206,12 +391,15 @@ class ResultDisplayMixin:
         self._create_iteration_table(table_container, iteration_data, method_name)
         
         # Información adicional
-        if len(iteration_data) > 0:
+        if n_iterations > 0:
             info_frame = ctk.CTkFrame(main_frame)
             info_frame.pack(fill="x", padx=10, pady=(5, 10))
             
             # Mostrar resultado final
-            last_iter = iteration_data[-1]
+            if columnar:
+                last_iter = {key: column[-1].item() for key, column in iteration_data.items()}
+            else:
+                last_iter = iteration_data[-1]
             
             # Determinar si convergió (basado en número de iteraciones o flag de convergencia)
             if isinstance(last_iter, dict) and 'converged' in last_iter:
@@ -219,17 +407,17 @@ class ResultDisplayMixin:
             else:
                 # Aproximación basada en número de iteraciones máximas
                 max_iterations = 100  # Valor predeterminado
-                converged = len(iteration_data) < max_iterations
+                converged = n_iterations < max_iterations
             
             # Obtener error final
             error_final = last_iter.get('error', 0) if isinstance(last_iter, dict) else 0
             
             result_label = ctk.CTkLabel(
                 info_frame,
-                text=f"Resultado final: {len(iteration_data)} iteraciones | " + 
+                text=f"Resultado final: {n_iterations} iteraciones | " + 
                      f"Error final: {format_decimal_number(error_final, 8)} | " +
                      f"Estado: {'✓ Convergió' if converged else '⚠ Alcanzó máximo de iteraciones'}",
-                font=ctk.CTkFont(size=13)
+                font=self._get_font(13)
             )
             result_label.pack(pady=10, padx=20)
         
@@ -240,38 +428,104 @@ class ResultDisplayMixin:
         close_button = ctk.CTkButton(
             buttons_frame,
             text="Cerrar",
-            command=popup.destroy,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            command=lambda: self._hide_iteration_popup(popup),
+            font=self._get_font(13, weight="bold"),
             width=120
         )
         close_button.pack(side="right", padx=20, pady=10)
         
-        # Centrar la ventana
-        popup.geometry("900x650+100+100")
+        # Mostrar la ventana ya construida, modal pero movible
+        if not reused:
+            popup.geometry("900x650+100+100")
+        popup.update_idletasks()
+        popup.deiconify()
+        if reused:
+            popup.lift()
+        else:
+            popup.transient(parent_widget)
+        popup.grab_set()
+
+    @staticmethod
+    def _hide_iteration_popup(popup) -> None:
+        """
+        Oculta el popup de iteraciones para reutilizarlo en la próxima ejecución.
+        """
+        popup.grab_release()
+        popup.withdraw()
     
     def _create_iteration_table(self, parent_frame, iteration_data, method_name: str) -> None:
         """
-        Crea una tabla de iteraciones visualmente mejorada usando un enfoque basado en grid.
+        Crea una tabla de iteraciones sobre un Treeview con carga perezosa de filas.
+        El formateo de tablas grandes se hace en un hilo de trabajo para no bloquear la UI.
         """
-        # Asegurar que iteration_data sea una lista
-        if isinstance(iteration_data, dict):
+        # Asegurar que iteration_data sea una lista (salvo datos por columnas)
+        columnar = is_columnar_iteration_data(iteration_data)
+        if isinstance(iteration_data, dict) and not columnar:
             iteration_data = [iteration_data]
-            
-        # Crear frame con scroll para la tabla
-        table_canvas = ctk.CTkScrollableFrame(parent_frame)
-        table_canvas.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Definir los headers según el método
-        if method_name.upper().startswith("BISECCIÓN"):
-            headers = ["Iter", "a", "b", "c", "f(c)", "Error"]
-        elif method_name.upper().startswith("NEWTON-RAPHSON"):
-            headers = ["Iter", "xₙ", "f(xₙ)", "f'(xₙ)", "xₙ₊₁", "Error"]
-        elif method_name.upper().startswith("PUNTO FIJO"):
-            headers = ["Iter", "xₙ", "g(xₙ)", "Error"]
-        elif method_name.upper().startswith("AITKEN"):
-            headers = ["Iter", "x", "x₁", "x₂", "x_aitken", "Error"]
-        elif method_name.upper().startswith("SECANTE"):
-            headers = ["Iter", "xₙ₋₁", "xₙ", "xₙ₊₁", "f(xₙ)", "Error"]
+        n_iterations = len(next(iter(iteration_data.values()))) if columnar else len(iteration_data)
+
+        if n_iterations < PREPARE_ROWS_THREAD_MIN:
+            headers, rows = self._prepare_rows(iteration_data, method_name)
+            self._install_rows(parent_frame, headers, rows)
+            return
+
+        # El formateo no toca widgets: se ejecuta fuera del hilo de Tk y el
+        # resultado se instala desde el hilo principal al estar listo
+        prepared = {}
+
+        def prepare():
+            try:
+                prepared["result"] = self._prepare_rows(iteration_data, method_name)
+            except Exception as e:
+                # Se guarda para informarlo desde el hilo de Tk
+                prepared["error"] = e
+
+        worker = threading.Thread(target=prepare, daemon=True)
+        worker.start()
+
+        def install_when_ready():
+            if not parent_frame.winfo_exists():
+                return
+            if worker.is_alive():
+                parent_frame.after(20, install_when_ready)
+                return
+            if "error" in prepared:
+                handle_error(prepared["error"], context="Tabla de iteraciones")
+                return
+            headers, rows = prepared["result"]
+            self._install_rows(parent_frame, headers, rows)
+
+        parent_frame.after(20, install_when_ready)
+
+    def _prepare_rows(self, iteration_data, method_name: str) -> tuple:
+        """
+        Formatea las filas de la tabla de iteraciones (sin crear widgets).
+
+        Returns:
+            Tupla (headers, rows) con rows como lista de tuplas de strings
+        """
+        # Definir los headers según el método (resuelto una sola vez)
+        # (value_keys: claves del diccionario de cada iteración, la última es el error)
+        value_keys = None
+        layout = ITERATION_TABLE_LAYOUTS.get(resolve_iteration_method(method_name))
+
+        if is_columnar_iteration_data(iteration_data):
+            if layout:
+                # Datos por columnas de un método conocido: formatear sin armar filas dict
+                headers, value_keys = layout
+                n_rows = len(next(iter(iteration_data.values())))
+                iterations = iteration_data.get('iteration', np.arange(1, n_rows + 1))
+                formatted = format_iteration_matrix(iteration_data, value_keys)
+                rows = [(str(iter_value), *values)
+                        for iter_value, values in zip(np.asarray(iterations).astype(np.int64).tolist(), formatted)]
+                return list(headers), rows
+            # Método no reconocido: convertir a filas y usar el formato genérico
+            keys = list(iteration_data)
+            iteration_data = [dict(zip(keys, values))
+                              for values in zip(*(column.tolist() for column in iteration_data.values()))]
+        if layout:
+            headers, value_keys = layout
+            headers = list(headers)
         else:
             # Para métodos no reconocidos, intentar derivar los headers del diccionario
             if iteration_data and isinstance(iteration_data[0], dict):
@@ -287,98 +541,30 @@ class ResultDisplayMixin:
                 # Default genérico
                 headers = ["Iter", "Datos"]
         
-        # Configurar ancho de columnas
-        col_width = 115
-        iter_width = 60
-        error_width = 130
-        
-        # Color para headers y filas alternadas
-        header_bg = "#1a1a2e"
-        alt_row_bg = "#2a2a3e"
-        
-        # Configurar el grid para que las columnas se distribuyan adecuadamente
-        for i in range(len(headers)):
-            table_canvas.grid_columnconfigure(i, weight=1)
+        # Formatear todas las filas una sola vez (sin límite: el Treeview solo dibuja lo visible)
         
-        # Crear headers
-        for col, header in enumerate(headers):
-            width = iter_width if col == 0 else error_width if header == "Error" else col_width
-            frame = ctk.CTkFrame(table_canvas, fg_color=header_bg, corner_radius=0)
-            frame.grid(row=0, column=col, sticky="nsew", padx=1, pady=1)
-            
-            label = ctk.CTkLabel(
-                frame, 
-                text=header,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                anchor="center",
-                width=width,
-                height=30
-            )
-            label.pack(fill="both", expand=True)
+        # Para métodos conocidos, formatear todos los valores numéricos de una vez con NumPy
+        formatted = None
+        if value_keys and all(isinstance(data, dict) for data in iteration_data):
+            try:
+                formatted = format_iteration_matrix(iteration_data, value_keys)
+            except (TypeError, ValueError):
+                formatted = None  # Valores no numéricos: formatear fila por fila
         
-            # Mostrar datos (limitar a 100 para mejorar rendimiento)
-        max_rows = min(len(iteration_data), 100)
-        for row, data in enumerate(iteration_data[:max_rows], start=1):
-            row_bg = alt_row_bg if row % 2 == 0 else None
-            
-            # Columna de iteración
-            iter_frame = ctk.CTkFrame(table_canvas, fg_color=row_bg, corner_radius=0)
-            iter_frame.grid(row=row, column=0, sticky="nsew", padx=1, pady=1)
-            
+        rows = []
+        for row, data in enumerate(iteration_data, start=1):
             # Usar el valor de iteración si existe, o el índice si no
             iter_value = data.get('iteration', row) if isinstance(data, dict) else row
             
-            iter_label = ctk.CTkLabel(
-                iter_frame,
-                text=str(iter_value),
-                font=ctk.CTkFont(size=12),
-                anchor="center",
-                width=iter_width
-            )
-            iter_label.pack(fill="both")
-            
             # Extraer datos según el método
             if not isinstance(data, dict):
                 # Si no es un diccionario, mostrar como texto en una sola columna
                 values = [str(data)]
-            elif method_name.upper().startswith("BISECCIÓN"):
-                values = [
-                    f"{data.get('a', 0):.6f}",
-                    f"{data.get('b', 0):.6f}",
-                    f"{data.get('c', 0):.6f}",
-                    f"{data.get('f_c', 0):.6f}",
-                    format_decimal_number(data.get('error', 0), 8)
-                ]
-            elif method_name.upper().startswith("NEWTON-RAPHSON"):
-                values = [
-                    f"{data.get('x_n', 0):.6f}",
-                    f"{data.get('f_x_n', 0):.6f}",
-                    f"{data.get('df_x_n', 0):.6f}",
-                    f"{data.get('x_n_plus_1', 0):.6f}",
-                    format_decimal_number(data.get('error', 0), 8)
-                ]
-            elif method_name.upper().startswith("PUNTO FIJO"):
-                values = [
-                    f"{data.get('x_n', 0):.6f}",
-                    f"{data.get('g_x_n', 0):.6f}",
-                    format_decimal_number(data.get('error', 0), 8)
-                ]
-            elif method_name.upper().startswith("AITKEN"):
-                values = [
-                    f"{data.get('x', 0):.6f}",
-                    f"{data.get('x1', 0):.6f}",
-                    f"{data.get('x2', 0):.6f}",
-                    f"{data.get('x_aitken', 0):.6f}",
-                    format_decimal_number(data.get('error', 0), 8)
-                ]
-            elif method_name.upper().startswith("SECANTE"):
-                values = [
-                    f"{data.get('x_prev', 0):.6f}",
-                    f"{data.get('x_curr', 0):.6f}",
-                    f"{data.get('x_new', 0):.6f}",
-                    f"{data.get('f_curr', 0):.6f}",
-                    format_decimal_number(data.get('error', 0), 8)
-                ]
+            elif formatted is not None:
+                values = formatted[row - 1]
+            elif value_keys:
+                values = [f"{data.get(key, 0):.6f}" for key in value_keys[:-1]]
+                values.append(format_decimal_number(data.get(value_keys[-1], 0), 8))
             else:
                 # Para casos genéricos o no reconocidos
                 if isinstance(data, dict):
@@ -423,43 +609,118 @@ class ResultDisplayMixin:
                 extra_values = values[expected_cols-1:]
                 values = values[:expected_cols-1] + [", ".join(extra_values)]
             
-            # Mostrar valores
-            for col, value in enumerate(values, start=1):
-                width = error_width if col == len(values) else col_width
-                cell_frame = ctk.CTkFrame(table_canvas, fg_color=row_bg, corner_radius=0)
-                cell_frame.grid(row=row, column=col, sticky="nsew", padx=1, pady=1)
-                
-                # Si el texto es demasiado largo, agregar ellipsis
-                if len(value) > 20:
-                    display_value = value[:17] + "..."
-                else:
-                    display_value = value
-                
-                cell_label = ctk.CTkLabel(
-                    cell_frame,
-                    text=display_value,
-                    font=ctk.CTkFont(size=12),
-                    anchor="center",
-                    width=width
-                )
-                cell_label.pack(fill="both", expand=True)
-                
-                # Agregar tooltip para valores largos
-                if len(value) > 20:
-                    cell_label._tooltip_label = value  # Almacenar valor completo para tooltip
+            rows.append((str(iter_value), *values))
+
+        return headers, rows
+
+    def _install_rows(self, parent_frame, headers: list, rows: list) -> None:
+        """
+        Crea el Treeview e inserta las filas ya formateadas.
+        """
+        # Configurar ancho de columnas
+        col_width = 115
+        iter_width = 60
+        error_width = 130
         
-        # Mensaje si hay más iteraciones
-        if len(iteration_data) > max_rows:
-            note_frame = ctk.CTkFrame(table_canvas)
-            note_frame.grid(row=max_rows+1, column=0, columnspan=len(headers), 
-                           sticky="ew", padx=5, pady=10)
-            
-            note_label = ctk.CTkLabel(
-                note_frame,
-                text=f"Mostrando {max_rows} de {len(iteration_data)} iteraciones",
-                font=ctk.CTkFont(size=12, slant="italic")
+        # Color para filas alternadas
+        alt_row_bg = "#2a2a3e"
+        
+        # Treeview nativo: un solo widget para toda la tabla en lugar de
+        # un CTkFrame + CTkLabel por celda
+        columns = tuple(f"col{i}" for i in range(len(headers)))
+        tree = ttk.Treeview(
+            parent_frame,
+            columns=columns,
+            show="headings",
+            height=20,
+            style=self._get_iteration_tree_style(parent_frame)
+        )
+        for col, (column_id, header) in enumerate(zip(columns, headers)):
+            width = iter_width if col == 0 else error_width if header == "Error" else col_width
+            tree.heading(column_id, text=header)
+            tree.column(column_id, width=width, anchor="center")
+        tree.tag_configure("even", background=alt_row_bg)
+        
+        scrollbar = ctk.CTkScrollbar(parent_frame, command=tree.yview)
+        scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        tree.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Inserción perezosa: solo se cargan las filas necesarias para llenar
+        # la vista; el resto se agrega a medida que el scroll llega al final
+        loaded = 0
+
+        def load_more_rows():
+            nonlocal loaded
+            end = min(loaded + TABLE_ROWS_CHUNK, len(rows))
+            for index in range(loaded, end):
+                # Si el texto es demasiado largo, agregar ellipsis (el tooltip muestra el completo)
+                display_values = [value[:17] + "..." if len(value) > 20 else value
+                                  for value in rows[index]]
+                tree.insert("", "end", iid=str(index), values=display_values,
+                            tags=("even",) if index % 2 == 1 else ())
+            loaded = end
+
+        def on_tree_yscroll(first, last):
+            scrollbar.set(first, last)
+            if loaded < len(rows) and float(last) >= 1.0:
+                load_more_rows()
+
+        tree.configure(yscrollcommand=on_tree_yscroll)
+        load_more_rows()
+        self._attach_cell_tooltip(tree, rows)
+
+    def _attach_cell_tooltip(self, tree: ttk.Treeview, rows: list) -> None:
+        """
+        Muestra el valor completo de las celdas truncadas con un único
+        manejador <Motion> y una sola ventana de tooltip reutilizable.
+        """
+        tooltip = tk.Toplevel(tree)
+        tooltip.withdraw()
+        tooltip.overrideredirect(True)
+        tooltip_label = tk.Label(tooltip, bg="#1a1a2e", fg="white", padx=6, pady=3)
+        tooltip_label.pack()
+
+        def on_motion(event):
+            row_id = tree.identify_row(event.y)
+            column_id = tree.identify_column(event.x)
+            if row_id and column_id:
+                value = rows[int(row_id)][int(column_id[1:]) - 1]
+                if len(value) > 20:
+                    tooltip_label.configure(text=value)
+                    tooltip.geometry(f"+{event.x_root + 12}+{event.y_root + 12}")
+                    tooltip.deiconify()
+                    return
+            tooltip.withdraw()
+
+        tree.bind("<Motion>", on_motion)
+        tree.bind("<Leave>", lambda event: tooltip.withdraw())
+
+    @classmethod
+    def _get_iteration_tree_style(cls, widget) -> str:
+        """
+        Configura una única vez el estilo oscuro del Treeview de iteraciones.
+        """
+        if not cls._iteration_tree_style_ready:
+            style = ttk.Style(widget)
+            style.configure(
+                "Iteration.Treeview",
+                background="#2b2b2b",
+                fieldbackground="#2b2b2b",
+                foreground="white",
+                rowheight=28,
+                borderwidth=0,
+                font=("", 12)
             )
-            note_label.pack(pady=5)
+            style.configure(
+                "Iteration.Treeview.Heading",
+                background="#1a1a2e",
+                foreground="white",
+                relief="flat",
+                font=("", 13, "bold")
+            )
+            style.map("Iteration.Treeview", background=[("selected", "#1f538d")])
+            cls._iteration_tree_style_ready = True
+        return "Iteration.Treeview"
 
 
 class PlottingMixin:
@@ -473,9 +734,26 @@ class PlottingMixin:
         Configura área de graficación de forma estandarizada.
         Principio DRY: configuración de matplotlib reutilizable.
 
+        La figura y el canvas se crean una sola vez por frame; en las llamadas
+        siguientes solo se limpia la figura y se reutiliza el mismo canvas.
+
         Returns:
             Tupla (figure, canvas)
         """
+        if not hasattr(self, '_plot_areas'):
+            self._plot_areas = {}
+
+        cached = self._plot_areas.get(id(plot_frame))
+        if cached is not None:
+            fig, canvas = cached
+            if canvas.get_tk_widget().winfo_exists():
+                fig.clear()
+                # Los puntos reutilizables pertenecen a los ejes anteriores
+                getattr(self, '_point_artists', {}).clear()
+                fig.patch.set_facecolor('#2b2b2b')
+                return fig, canvas
+            self.invalidate_plot_area(plot_frame)
+
         # Limpiar widgets existentes
         for widget in plot_frame.winfo_children():
             widget.destroy()
@@ -492,38 +770,82 @@ class PlottingMixin:
         canvas = FigureCanvasTkAgg(fig, plot_frame)
         canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
 
+        self._plot_areas[id(plot_frame)] = (fig, canvas)
         return fig, canvas
 
+    def invalidate_plot_area(self, plot_frame: ctk.CTkFrame) -> None:
+        """
+        Descarta la figura reutilizable asociada a un frame (p. ej. si el frame se destruye).
+        """
+        cached = getattr(self, '_plot_areas', {}).pop(id(plot_frame), None)
+        if cached is not None:
+            plt.close(cached[0])
+
     def apply_standard_plot_styling(self, ax, title: str = "",
                                    xlabel: str = "", ylabel: str = "") -> None:
         """
         Aplica estilo estándar a los gráficos.
         Principio DRY: estilo visual unificado.
+
+        Los colores de ticks, bordes, grilla y textos vienen del estilo global
+        (configure_matplotlib); aquí solo se aplica lo propio de estas pestañas.
         """
-        ax.set_facecolor('#2b2b2b')
-        ax.set_title(title, color='white', fontsize=14, fontweight='bold')
-        ax.set_xlabel(xlabel, color='white', fontsize=12)
-        ax.set_ylabel(ylabel, color='white', fontsize=12)
+        ax.set_facecolor(_PLOT_BG)
+        ax.set_title(title, **_TITLE_STYLE)
+        ax.set_xlabel(xlabel, **_LABEL_STYLE)
+        ax.set_ylabel(ylabel, **_LABEL_STYLE)
 
         # Configurar grid
-        if PLOT_CONFIG["grid"]:
-            ax.grid(True, alpha=0.3, color='white')
+        if _GRID_ENABLED:
+            ax.grid(True, **_GRID_STYLE)
 
         # Configurar ticks
-        ax.tick_params(colors='white', labelsize=10)
-
-        # Configurar spines
-        for spine in ax.spines.values():
-            spine.set_color('white')
+        ax.tick_params(**_TICK_STYLE)
 
         # Leyenda si está habilitada
-        if PLOT_CONFIG["legend"]:
+        if _LEGEND_ENABLED:
             legend = ax.legend()
             if legend:
-                legend.get_frame().set_facecolor('#2b2b2b')
+                legend.get_frame().set_facecolor(_PLOT_BG)
                 legend.get_frame().set_edgecolor('white')
-                for text in legend.get_texts():
-                    text.set_color('white')
+
+    def _grid(self, x_range: tuple, n_points: int = 201) -> np.ndarray:
+        """
+        Obtiene la grilla np.linspace para el rango dado, reutilizando la última calculada.
+        """
+        if not hasattr(self, '_xvals_cache'):
+            self._xvals_cache = {}
+
+        key = (float(x_range[0]), float(x_range[1]), n_points)
+        x_vals = self._xvals_cache.get(key)
+        if x_vals is None:
+            # Limitar el tamaño del cache (pocos rangos distintos por pestaña)
+            if len(self._xvals_cache) >= 8:
+                self._xvals_cache.clear()
+            x_vals = np.linspace(key[0], key[1], n_points)
+            x_vals.flags.writeable = False  # Compartida entre curvas: solo lectura
+            self._xvals_cache[key] = x_vals
+        return x_vals
+
+    @staticmethod
+    def _evaluate_on_grid(function: Callable, x_vals: np.ndarray) -> np.ndarray:
+        """
+        Evalúa la función sobre toda la grilla en una sola llamada vectorizada.
+        Si la función no acepta arrays, se evalúa punto a punto.
+        """
+        try:
+            with np.errstate(all="ignore"):
+                y_vals = np.asarray(function(x_vals), dtype=np.float64)
+            if y_vals.shape == x_vals.shape:
+                return y_vals
+            if y_vals.ndim == 0:
+                # Funciones constantes devuelven un escalar
+                return np.full_like(x_vals, y_vals)
+        except (TypeError, ValueError, ArithmeticError):
+            pass
+
+        return np.fromiter((function(float(x)) for x in x_vals),
+                           dtype=np.float64, count=len(x_vals))
 
     def plot_function_with_points(self, fig, ax, function: Callable[[float], float],
                                  x_range: tuple, points: list = None,
@@ -532,27 +854,42 @@ class PlottingMixin:
         Grafica función con puntos destacados.
         Principio DRY: graficación de funciones reutilizable.
         """
-        x_min, x_max = x_range
-        x_vals = [x_min + i * (x_max - x_min) / 200 for i in range(201)]
-        y_vals = [function(x) for x in x_vals]
+        x_vals = self._grid(x_range)
+        y_vals = self._evaluate_on_grid(function, x_vals)
 
         ax.plot(x_vals, y_vals, 'b-', linewidth=2, label='f(x)')
 
-        # Graficar puntos si se proporcionan
-        if points:
-            x_points = [p[0] for p in points]
-            y_points = [p[1] for p in points]
-
-            ax.scatter(x_points, y_points, color='red', s=50, zorder=5)
-
-            if point_labels:
-                for i, (x, y) in enumerate(zip(x_points, y_points)):
-                    if i < len(point_labels):
-                        ax.annotate(point_labels[i], (x, y),
-                                  xytext=(10, 10), textcoords='offset points',
-                                  color='white', fontsize=10,
-                                  bbox=dict(boxstyle='round,pad=0.3',
-                                           facecolor='#2b2b2b', alpha=0.8))
+        # Graficar puntos si se proporcionan (o actualizar los de un gráfico anterior)
+        if not hasattr(self, '_point_artists'):
+            self._point_artists = {}
+        cached = self._point_artists.get(id(ax))
+        if cached is not None and cached[0].axes is not ax:
+            cached = None
+
+        if points or cached is not None:
+            point_array = np.asarray(points or [], dtype=np.float64).reshape(-1, 2)
+
+            # Un único PathCollection por eje: las llamadas siguientes solo mueven los puntos
+            if cached is None:
+                scatter = ax.scatter(point_array[:, 0], point_array[:, 1], color='red', s=50, zorder=5)
+                annotations = []
+                self._point_artists[id(ax)] = (scatter, annotations)
+            else:
+                scatter, annotations = cached
+                scatter.set_offsets(point_array)
+
+            # zip corta en la lista más corta (etiquetas sin punto se ignoran)
+            labeled = list(zip(point_labels or (), point_array[:, 0], point_array[:, 1]))
+
+            # Reutilizar las anotaciones existentes y crear solo las que falten
+            for annotation, (label, x, y) in zip(annotations, labeled):
+                annotation.set_text(label)
+                annotation.xy = (x, y)
+                annotation.set_visible(True)
+            for label, x, y in labeled[len(annotations):]:
+                annotations.append(ax.annotate(label, (x, y), bbox=_ANNOTATION_BBOX, **_ANNOTATION_STYLE))
+            for annotation in annotations[len(labeled):]:
+                annotation.set_visible(False)
 
         ax.legend()
 
@@ -565,11 +902,18 @@ class PlottingMixin:
             functions: Lista de tuplas (function, color, label)
             x_range: Tupla (x_min, x_max)
         """
-        x_min, x_max = x_range
-        x_vals = [x_min + i * (x_max - x_min) / 200 for i in range(201)]
+        x_vals = self._grid(x_range)
         
-        for func, color, label in functions:
-            y_vals = [func(x) for x in x_vals]
-            ax.plot(x_vals, y_vals, color=color, linewidth=2, label=label)
+        # Evaluar todas las curvas y dibujarlas como un único artista (LineCollection)
+        if functions:
+            y_matrix = np.stack([self._evaluate_on_grid(func, x_vals) for func, _, _ in functions])
+            segments = np.stack([np.broadcast_to(x_vals, y_matrix.shape), y_matrix], axis=-1)
+            colors = [color for _, color, _ in functions]
+            ax.add_collection(LineCollection(segments, colors=colors, linewidths=2))
+            ax.autoscale_view()
+
+            # Líneas vacías que solo aportan las entradas de la leyenda
+            for _, color, label in functions:
+                ax.plot([], [], color=color, linewidth=2, label=label)
         
         ax.legend()
@@ -5,18 +5,10 @@ Implementa el patrón Factory Method para centralizar la creación de pestañas
 y mejorar la mantenibilidad siguiendo principios SOLID.
 """
 
-from typing import Dict, Type, Any
+import importlib
+from typing import Dict, Type, Any, Union
 import customtkinter as ctk
 
-from src.ui.tabs.roots_tab import RootsTab
-from src.ui.tabs.integration_tab import IntegrationTab
-from src.ui.tabs.ode_tab_new import ODETab
-from src.ui.tabs.finite_diff_tab import FiniteDiffTab
-from src.ui.tabs.newton_cotes_tab import NewtonCotesTab
-from src.ui.tabs.monte_carlo_tab import MonteCarloTab
-from src.ui.tabs.monte_carlo_3d_tab import MonteCarlo3DTab
-from src.ui.tabs.credits_tab import CreditsTab
-
 
 class TabFactory:
     """
@@ -24,18 +16,22 @@ class TabFactory:
     Principio de responsabilidad única: solo crea pestañas.
     """
 
-    # Registro de pestañas disponibles
-    _tab_registry: Dict[str, Type] = {
-        "roots": RootsTab,
-        "integration": IntegrationTab,
-        "ode": ODETab,
-        "finite_diff": FiniteDiffTab,
-        "newton_cotes": NewtonCotesTab,
-        "monte_carlo": MonteCarloTab,
-        "monte_carlo_3d": MonteCarlo3DTab,
-        "credits": CreditsTab,
+    # Registro de pestañas disponibles ("módulo:Clase"); los módulos se
+    # importan recién cuando se crea la pestaña
+    _tab_registry: Dict[str, Union[Type, str]] = {
+        "roots": "src.ui.tabs.roots_tab:RootsTab",
+        "integration": "src.ui.tabs.integration_tab:IntegrationTab",
+        "ode": "src.ui.tabs.ode_tab_new:ODETab",
+        "finite_diff": "src.ui.tabs.finite_diff_tab:FiniteDiffTab",
+        "newton_cotes": "src.ui.tabs.newton_cotes_tab:NewtonCotesTab",
+        "monte_carlo": "src.ui.tabs.monte_carlo_tab:MonteCarloTab",
+        "monte_carlo_3d": "src.ui.tabs.monte_carlo_3d_tab:MonteCarlo3DTab",
+        "credits": "src.ui.tabs.credits_tab:CreditsTab",
     }
 
+    # Clases ya importadas a partir del registro
+    _resolved_cache: Dict[str, Type] = {}
+
     @classmethod
     def create_tab(cls, tab_type: str, parent: ctk.CTkFrame, **kwargs) -> Any:
         """
@@ -55,9 +51,25 @@ class TabFactory:
         if tab_type not in cls._tab_registry:
             raise ValueError(f"Tipo de pestaña no registrado: {tab_type}")
 
-        tab_class = cls._tab_registry[tab_type]
+        tab_class = cls._resolve_tab_class(tab_type)
         return tab_class(parent, **kwargs)
 
+    @classmethod
+    def _resolve_tab_class(cls, tab_type: str) -> Type:
+        """
+        Obtiene la clase de la pestaña, importando su módulo la primera vez.
+        """
+        tab_class = cls._resolved_cache.get(tab_type)
+        if tab_class is None:
+            entry = cls._tab_registry[tab_type]
+            if isinstance(entry, str):
+                module_path, class_name = entry.split(":")
+                tab_class = getattr(importlib.import_module(module_path), class_name)
+            else:
+                tab_class = entry
+            cls._resolved_cache[tab_type] = tab_class
+        return tab_class
+
     @classmethod
     def get_available_tabs(cls) -> list:
         """
@@ -69,15 +81,29 @@ class TabFactory:
         return list(cls._tab_registry.keys())
 
     @classmethod
-    def register_tab(cls, tab_type: str, tab_class: Type) -> None:
+    def is_registered(cls, tab_type: str) -> bool:
+        """
+        Indica si hay una pestaña registrada para el tipo dado, sin armar la lista completa.
+
+        Args:
+            tab_type: Tipo de pestaña a consultar
+
+        Returns:
+            True si el tipo está registrado
+        """
+        return tab_type in cls._tab_registry
+
+    @classmethod
+    def register_tab(cls, tab_type: str, tab_class: Union[Type, str]) -> None:
         """
         Registra una nueva pestaña en el factory.
 
         Args:
             tab_type: Identificador único de la pestaña
-            tab_class: Clase de la pestaña a registrar
+            tab_class: Clase de la pestaña o ruta "módulo:Clase" para importarla al usarla
         """
         cls._tab_registry[tab_type] = tab_class
+        cls._resolved_cache.pop(tab_type, None)
 
     @classmethod
     def unregister_tab(cls, tab_type: str) -> None:
@@ -89,6 +115,19 @@ class TabFactory:
         """
         if tab_type in cls._tab_registry:
             del cls._tab_registry[tab_type]
+        cls._resolved_cache.pop(tab_type, None)
+
+
+# Fuentes de las pestañas placeholder por (tamaño, peso), creadas al primer uso
+_PLACEHOLDER_FONTS: Dict[tuple, ctk.CTkFont] = {}
+
+
+def _get_placeholder_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Devuelve una fuente compartida para las pestañas placeholder."""
+    font = _PLACEHOLDER_FONTS.get((size, weight))
+    if font is None:
+        font = _PLACEHOLDER_FONTS[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+    return font
 
 
 def create_placeholder_tab(parent: ctk.CTkFrame, title: str, description: str) -> ctk.CTkFrame:
@@ -113,7 +152,7 @@ def create_placeholder_tab(parent: ctk.CTkFrame, title: str, description: str) -
     title_label = ctk.CTkLabel(
         placeholder,
         text=title,
-        font=ctk.CTkFont(size=28, weight="bold")
+        font=_get_placeholder_font(28, weight="bold")
     )
     title_label.grid(row=0, column=0, pady=(40, 20))
 
@@ -121,7 +160,7 @@ def create_placeholder_tab(parent: ctk.CTkFrame, title: str, description: str) -
     desc_label = ctk.CTkLabel(
         placeholder,
         text=description,
-        font=ctk.CTkFont(size=16),
+        font=_get_placeholder_font(16),
         text_color=["gray60", "gray50"]
     )
     desc_label.grid(row=1, column=0, pady=10)
@@ -133,7 +172,7 @@ def create_placeholder_tab(parent: ctk.CTkFrame, title: str, description: str) -
     status_label = ctk.CTkLabel(
         status_frame,
         text="🚧 MÓDULO EN DESARROLLO 🚧",
-        font=ctk.CTkFont(size=18, weight="bold"),
+        font=_get_placeholder_font(18, weight="bold"),
         text_color=["orange", "yellow"]
     )
     status_label.pack(pady=20, padx=40)
@@ -141,7 +180,7 @@ def create_placeholder_tab(parent: ctk.CTkFrame, title: str, description: str) -
     info_label = ctk.CTkLabel(
         status_frame,
         text="Este módulo será implementado en la próxima versión.\nUse la estructura modular para acceder a esta funcionalidad.",
-        font=ctk.CTkFont(size=14),
+        font=_get_placeholder_font(14),
         justify="center"
     )
     info_label.pack(pady=(0, 20), padx=40)
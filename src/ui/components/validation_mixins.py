@@ -7,12 +7,98 @@ feedback visual y validadores especializados.
 
 import customtkinter as ctk
 import re
+from functools import partial
 from typing import Dict, Any, Optional, Callable, List
 from enum import Enum
 
-from .constants import VALIDATION, ALLOWED_FUNCTIONS, ALLOWED_CHARS, ValidationErrorCodes
+from .constants import VALIDATION, ALLOWED_FUNCTIONS, ALLOWED_CHARS, ValidationErrorCodes, is_valid_expr
 from .error_handler import handle_validation_error
 
+# Espera (ms) tras la última tecla antes de validar un campo
+VALIDATION_DEBOUNCE_MS = 300
+
+# Operadores aritméticos consecutivos (tras quitar las potencias '**')
+_CONSECUTIVE_OPS_RE = re.compile(r'[+\-*/]{2,}')
+
+# Tabla de traducción que elimina los caracteres permitidos (quedan solo los inválidos)
+_DISALLOWED_TABLE = str.maketrans('', '', ''.join(ALLOWED_CHARS))
+
+# Caracteres que indican un número de punto flotante
+_FLOAT_MARKERS = frozenset('.eE')
+
+# Fuente compartida por los labels de feedback (se crea al primer uso, con la ventana ya creada)
+_FEEDBACK_FONT = None
+
+
+def _get_feedback_font() -> ctk.CTkFont:
+    """Devuelve la fuente de los labels de feedback, creándola una sola vez."""
+    global _FEEDBACK_FONT
+    if _FEEDBACK_FONT is None:
+        _FEEDBACK_FONT = ctk.CTkFont(size=10)
+    return _FEEDBACK_FONT
+
+
+def _coerce_value(value_str: str) -> Any:
+    """
+    Convierte el texto de un campo a int o float si es posible;
+    si no es numérico se devuelve el texto tal cual.
+    """
+    try:
+        if not _FLOAT_MARKERS.isdisjoint(value_str):
+            return float(value_str)
+        return int(value_str)
+    except ValueError:
+        return value_str
+
+
+def _validate_range(start_value: str, end_value: str,
+                    start_label: str = "límite inferior",
+                    end_label: str = "límite superior") -> tuple[bool, str]:
+    """
+    Valida que el rango sea correcto (inicio < fin).
+
+    Args:
+        start_value: Valor del límite inferior
+        end_value: Valor del límite superior
+        start_label: Etiqueta para el límite inferior
+        end_label: Etiqueta para el límite superior
+
+    Returns:
+        Tupla (is_valid, error_message)
+    """
+    try:
+        start = float(start_value)
+        end = float(end_value)
+
+        if start >= end:
+            return False, f"El {start_label} debe ser menor que el {end_label}"
+
+        return True, ""
+    except ValueError:
+        return False, "Los valores del rango deben ser números válidos"
+
+
+def _validate_required(value: str) -> tuple[bool, str]:
+    """Valida que el campo no esté vacío."""
+    if not value.strip():
+        return False, "Campo requerido"
+    return True, ""
+
+
+def _build_required_validator(mixin, params):
+    """Constructor por defecto: los tipos desconocidos solo exigen un valor."""
+    return _validate_required
+
+
+# Constructores de validadores por tipo de campo (usados en setup_validation_for_tab)
+_VALIDATOR_BUILDERS = {
+    'numeric': lambda mixin, params: partial(mixin.validate_numeric, **params),
+    'integer': lambda mixin, params: partial(mixin.validate_integer, **params),
+    'function': lambda mixin, params: mixin.validate_function,
+    'positive': lambda mixin, params: mixin.validate_positive_number,
+    'tolerance': lambda mixin, params: mixin.validate_tolerance,
+}
+
 
 class ValidationState(Enum):
     """Estados posibles de validación"""
@@ -22,6 +108,15 @@ class ValidationState(Enum):
     PENDING = "pending"
 
 
+# Apariencia del borde del campo según su estado de validación
+_APPEARANCE = {
+    ValidationState.VALID: {"border_color": "#28a745", "border_width": 2},    # Verde
+    ValidationState.INVALID: {"border_color": "#dc3545", "border_width": 2},  # Rojo
+    ValidationState.EMPTY: {"border_color": "#6c757d", "border_width": 1},    # Gris
+    ValidationState.PENDING: {"border_color": "#ffc107", "border_width": 1},  # Amarillo
+}
+
+
 class RealTimeValidationMixin:
     """
     Mixin para validación en tiempo real de entradas de usuario.
@@ -32,6 +127,13 @@ class RealTimeValidationMixin:
         self._validation_states = {}
         self._validation_callbacks = {}
         self._field_validators = {}
+        self._pending_after = {}
+        self._validation_cache = {}
+        self._applied_states = {}
+        self._feedback_texts = {}
+        self._entries_ref = {}
+        self._invalid_fields = set()
+        self._empty_fields = set()
 
     def setup_realtime_validation(self, entries: Dict[str, ctk.CTkEntry],
                                  validators: Dict[str, Callable[[str], tuple[bool, str]]]) -> None:
@@ -43,35 +145,77 @@ class RealTimeValidationMixin:
             validators: Diccionario de funciones validadoras por campo
         """
         self._field_validators = validators
+        self._entries_ref = entries
+        # Validadores nuevos: descartar resultados anteriores
+        self._validation_cache = {}
+
+        for field_name in validators:
+            entry = entries.get(field_name)
+            if entry is None:
+                continue
+
+            # Estado inicial
+            self._validation_states[field_name] = ValidationState.EMPTY
+            self._empty_fields.add(field_name)
+            self._invalid_fields.discard(field_name)
+
+            # Configurar callback de validación (al escribir se agrupan las teclas;
+            # al salir del campo se valida de inmediato). El entry se pasa
+            # directamente y Tk agrega el evento como último argumento.
+            entry.bind("<KeyRelease>", partial(self._schedule_validation, field_name, entry))
+            entry.bind("<FocusOut>", partial(self._flush_validation, field_name, entry))
 
-        for field_name, entry in entries.items():
-            if field_name in validators:
-                # Estado inicial
-                self._validation_states[field_name] = ValidationState.EMPTY
+            # Configurar colores iniciales
+            self._update_field_appearance(entry, ValidationState.EMPTY)
+
+    def _schedule_validation(self, field_name: str, entry: ctk.CTkEntry, event=None) -> None:
+        """
+        Programa la validación del campo tras VALIDATION_DEBOUNCE_MS, cancelando
+        la pendiente si el usuario sigue escribiendo.
+        """
+        pending = self._pending_after.pop(field_name, None)
+        if pending is not None:
+            entry.after_cancel(pending)
 
-                # Configurar callback de validación
-                entry.bind("<KeyRelease>", lambda e, fn=field_name: self._validate_field_realtime(fn))
-                entry.bind("<FocusOut>", lambda e, fn=field_name: self._validate_field_realtime(fn))
+        def run():
+            self._pending_after.pop(field_name, None)
+            self._validate_field_realtime(field_name, entry)
 
-                # Configurar colores iniciales
-                self._update_field_appearance(entry, ValidationState.EMPTY)
+        self._pending_after[field_name] = entry.after(VALIDATION_DEBOUNCE_MS, run)
+
+    def _flush_validation(self, field_name: str, entry: ctk.CTkEntry, event=None) -> None:
+        """
+        Cancela la validación pendiente del campo y valida inmediatamente.
+        """
+        pending = self._pending_after.pop(field_name, None)
+        if pending is not None:
+            entry.after_cancel(pending)
+        self._validate_field_realtime(field_name, entry)
+
+    def _flush_pending(self) -> None:
+        """
+        Completa ya las validaciones que siguen esperando el debounce, para que
+        los estados y el cache reflejen lo que hay escrito en cada campo.
+        """
+        for field_name in list(self._pending_after):
+            entry = self._entries_ref.get(field_name)
+            if entry is not None:
+                self._flush_validation(field_name, entry)
 
-    def _validate_field_realtime(self, field_name: str) -> None:
+    def _validate_field_realtime(self, field_name: str, entry: Optional[ctk.CTkEntry] = None) -> None:
         """
         Valida un campo en tiempo real y actualiza su apariencia.
         """
         if field_name not in self._field_validators:
             return
 
-        entry = getattr(self, 'entries', {}).get(field_name)
-        if not entry:
-            return
+        if entry is None:
+            entry = self._entries_ref.get(field_name)
+            if not entry:
+                return
 
         value = entry.get().strip()
-        validator = self._field_validators[field_name]
-
-        # Ejecutar validación
-        is_valid, error_message = validator(value)
+        is_valid, error_message = self._run_field_validator(field_name, value)
 
         # Determinar estado
         if not value:
@@ -81,25 +225,46 @@ class RealTimeValidationMixin:
         else:
             state = ValidationState.INVALID
 
-        # Actualizar estado y apariencia
+        # Actualizar estado (y los conjuntos de campos inválidos/vacíos) y apariencia
         self._validation_states[field_name] = state
+        if state == ValidationState.INVALID:
+            self._invalid_fields.add(field_name)
+        else:
+            self._invalid_fields.discard(field_name)
+        if state == ValidationState.EMPTY:
+            self._empty_fields.add(field_name)
+        else:
+            self._empty_fields.discard(field_name)
         self._update_field_appearance(entry, state)
 
         # Mostrar/ocultar mensaje de error
         self._update_validation_feedback(field_name, error_message if not is_valid and value else "")
 
+    def _run_field_validator(self, field_name: str, value: str) -> tuple[bool, str]:
+        """
+        Ejecuta el validador del campo, reutilizando el último resultado si
+        el texto no cambió. Si el valor es válido también se guarda ya
+        convertido para get_validated_values.
+        """
+        cached = self._validation_cache.get(field_name)
+        if cached is not None and cached[0] == value:
+            return cached[1], cached[2]
+
+        is_valid, error_message = self._field_validators[field_name](value)
+        coerced = _coerce_value(value) if is_valid else None
+        self._validation_cache[field_name] = (value, is_valid, error_message, coerced)
+        return is_valid, error_message
+
     def _update_field_appearance(self, entry: ctk.CTkEntry, state: ValidationState) -> None:
         """
         Actualiza la apariencia visual del campo según su estado de validación.
+        Si el estado no cambió desde la última vez no se reconfigura el widget.
         """
-        if state == ValidationState.VALID:
-            entry.configure(border_color="#28a745", border_width=2)  # Verde
-        elif state == ValidationState.INVALID:
-            entry.configure(border_color="#dc3545", border_width=2)  # Rojo
-        elif state == ValidationState.EMPTY:
-            entry.configure(border_color="#6c757d", border_width=1)  # Gris
-        else:  # PENDING
-            entry.configure(border_color="#ffc107", border_width=1)  # Amarillo
+        if self._applied_states.get(id(entry)) == state:
+            return
+        self._applied_states[id(entry)] = state
+
+        entry.configure(**_APPEARANCE[state])
 
     def _update_validation_feedback(self, field_name: str, message: str) -> None:
         """
@@ -116,15 +281,22 @@ class RealTimeValidationMixin:
                 parent_frame,
                 text=message,
                 text_color="#dc3545",
-                font=ctk.CTkFont(size=10)
+                font=_get_feedback_font()
             )
             setattr(self, feedback_label_name, feedback_label)
             # Aquí se necesitaría lógica para posicionar el label correctamente
 
         if feedback_label:
+            # Solo tocar el widget cuando cambia el texto o la visibilidad
+            previous = self._feedback_texts.get(field_name)
+            if previous == message:
+                return
+            self._feedback_texts[field_name] = message
+
             if message:
                 feedback_label.configure(text=message)
-                feedback_label.pack()  # O grid, dependiendo del layout
+                if not previous:
+                    feedback_label.pack()  # O grid, dependiendo del layout
             else:
                 feedback_label.pack_forget()
 
@@ -135,131 +307,71 @@ class RealTimeValidationMixin:
         Returns:
             Tupla (is_valid, error_messages_dict)
         """
+        self._flush_pending()
+
+        # Los conjuntos se actualizan al validar cada campo: sin errores no hay que recorrer nada
+        if not self._invalid_fields and not self._empty_fields:
+            return True, {}
+
+        # Armar los mensajes en el orden de los campos con el resultado ya cacheado
         errors = {}
-        all_valid = True
-
-        for field_name, state in self._validation_states.items():
-            if state == ValidationState.INVALID:
-                all_valid = False
-                entry = getattr(self, 'entries', {}).get(field_name)
-                if entry:
-                    validator = self._field_validators.get(field_name)
-                    if validator:
-                        is_valid, error_msg = validator(entry.get().strip())
-                        if not is_valid:
-                            errors[field_name] = error_msg
-            elif state == ValidationState.EMPTY:
+        for field_name in self._validation_states:
+            if field_name in self._invalid_fields:
+                cached = self._validation_cache.get(field_name)
+                if cached is not None:
+                    errors[field_name] = cached[2]
+            elif field_name in self._empty_fields:
                 # Campos requeridos no pueden estar vacíos
-                all_valid = False
                 errors[field_name] = "Este campo es requerido"
 
-        return all_valid, errors
+        return False, errors
 
     def get_validated_values(self) -> Dict[str, Any]:
         """
         Obtiene los valores validados del formulario.
 
+        Los campos con validador se toman del cache si el texto actual del
+        entry coincide con el validado (ya convertidos); si no coincide, por
+        ejemplo porque se cambió desde código, se vuelven a validar. Los
+        campos sin validador se leen y convierten aquí.
+
         Returns:
             Diccionario con valores convertidos apropiadamente
+
+        Raises:
+            ValueError: Si algún campo con contenido no es válido
         """
-        values = {}
+        # Completar las validaciones pendientes del debounce para que el cache esté al día
+        self._flush_pending()
 
+        values = {}
+        errors = {}
         for field_name, entry in getattr(self, 'entries', {}).items():
             value_str = entry.get().strip()
-            if value_str:
-                # Intentar conversión automática
-                try:
-                    if '.' in value_str or 'e' in value_str.lower():
-                        values[field_name] = float(value_str)
-                    else:
-                        values[field_name] = int(value_str)
-                except ValueError:
-                    values[field_name] = value_str
-
-        return values
+            if not value_str:
+                continue
 
+            if field_name not in self._field_validators:
+                values[field_name] = _coerce_value(value_str)
+                continue
 
-    def setup_validation_for_tab(self, entries: Dict[str, ctk.CTkEntry],
-                                validation_config: Dict[str, Dict[str, Any]]) -> None:
-        """
-        Configura validación para una pestaña completa.
+            cached = self._validation_cache.get(field_name)
+            if cached is None or cached[0] != value_str:
+                self._validate_field_realtime(field_name, entry)
+                cached = self._validation_cache[field_name]
 
-        Args:
-            entries: Diccionario de campos de entrada
-            validation_config: Configuración de validación por campo
-        """
-        # Guardar referencia a los entries
-        self.entries = entries
-
-        # Crear validadores basados en la configuración
-        validators = {}
-        for field_name, config in validation_config.items():
-            validator_type = config.get("type", "text")
-            params = config.get("params", {})
-
-            if validator_type == "function":
-                validators[field_name] = self._create_function_validator()
-            elif validator_type == "numeric":
-                validators[field_name] = self._create_numeric_validator(params)
-            elif validator_type == "integer":
-                validators[field_name] = self._create_integer_validator(params)
-            elif validator_type == "tolerance":
-                validators[field_name] = self._create_tolerance_validator()
+            if cached[1]:
+                values[field_name] = cached[3]
             else:
-                validators[field_name] = self._create_text_validator()
-
-        # Configurar validación en tiempo real
-        self.setup_realtime_validation(entries, validators)
+                errors[field_name] = cached[2]
 
-    def _create_function_validator(self) -> Callable[[str], tuple[bool, str]]:
-        """Crea validador para funciones matemáticas."""
-        return lambda value: self.validate_function(value)
-
-    def _create_numeric_validator(self, params: Dict[str, Any]) -> Callable[[str], tuple[bool, str]]:
-        """Crea validador para números con parámetros."""
-        min_val = params.get("min_val")
-        max_val = params.get("max_val")
-        return lambda value: self.validate_numeric(value, min_val, max_val)
-
-    def _create_integer_validator(self, params: Dict[str, Any]) -> Callable[[str], tuple[bool, str]]:
-        """Crea validador para enteros con parámetros."""
-        min_val = params.get("min_val")
-        max_val = params.get("max_val")
-        return lambda value: self.validate_integer(value, min_val, max_val)
-
-    def _create_tolerance_validator(self) -> Callable[[str], tuple[bool, str]]:
-        """Crea validador para tolerancias."""
-        return lambda value: self.validate_tolerance(value)
-
-    def _create_text_validator(self) -> Callable[[str], tuple[bool, str]]:
-        """Crea validador básico para texto."""
-        return lambda value: (bool(value.strip()), "El campo no puede estar vacío" if not value.strip() else "")
-
-    def validate_range(self, start_value: str, end_value: str,
-                      start_label: str = "límite inferior",
-                      end_label: str = "límite superior") -> tuple[bool, str]:
-        """
-        Valida que el rango sea correcto (inicio < fin).
+        if errors:
+            raise ValueError("; ".join(f"{name}: {msg}" for name, msg in errors.items()))
 
-        Args:
-            start_value: Valor del límite inferior
-            end_value: Valor del límite superior
-            start_label: Etiqueta para el límite inferior
-            end_label: Etiqueta para el límite superior
+        return values
 
-        Returns:
-            Tupla (is_valid, error_message)
-        """
-        try:
-            start = float(start_value)
-            end = float(end_value)
-
-            if start >= end:
-                return False, f"El {start_label} debe ser menor que el {end_label}"
-
-            return True, ""
-        except ValueError:
-            return False, "Los valores del rango deben ser números válidos"
+    # Validación de rango compartida (ver _validate_range)
+    validate_range = staticmethod(_validate_range)
 
 
 class AdvancedValidationMixin:
@@ -304,7 +416,11 @@ class AdvancedValidationMixin:
             return False, "El campo no puede estar vacío"
 
         try:
-            int_value = int(float(value))  # Permite notación científica
+            # Camino rápido para dígitos; notación científica solo si falla
+            try:
+                int_value = int(value)
+            except ValueError:
+                int_value = int(float(value))
 
             if min_val is not None and int_value < min_val:
                 return False, f"El valor debe ser mayor o igual a {min_val}"
@@ -325,22 +441,36 @@ class AdvancedValidationMixin:
         if not value.strip():
             return False, "La función no puede estar vacía"
 
-        # Verificar caracteres permitidos
-        for char in value:
-            if char not in ALLOWED_CHARS:
-                return False, f"Carácter no permitido: '{char}'"
+        # Verificar caracteres permitidos (se busca el culpable solo si falla)
+        if not is_valid_expr(value):
+            disallowed = value.translate(_DISALLOWED_TABLE)
+            if disallowed:
+                return False, f"Carácter no permitido: '{disallowed[0]}'"
 
         # Verificar sintaxis básica
         try:
-            # Reemplazos comunes
-            test_expr = value.replace('^', '**').replace('sen', 'sin')
-
-            # Verificar paréntesis balanceados
-            if test_expr.count('(') != test_expr.count(')'):
+            # Reemplazos comunes (solo si aparecen; lo habitual es que no haga falta copiar)
+            test_expr = value
+            if '^' in test_expr:
+                test_expr = test_expr.replace('^', '**')
+            if 'sen' in test_expr:
+                test_expr = test_expr.replace('sen', 'sin')
+
+            # Verificar paréntesis balanceados (también el orden, p. ej. ")(")
+            # en una sola pasada con un contador de profundidad
+            depth = 0
+            for char in test_expr:
+                if char == '(':
+                    depth += 1
+                elif char == ')':
+                    depth -= 1
+                    if depth < 0:
+                        return False, "Los paréntesis no están balanceados"
+            if depth:
                 return False, "Los paréntesis no están balanceados"
 
             # Verificar que no haya operadores consecutivos
-            if re.search(r'[+\-*/]{2,}', test_expr.replace('**', '')):
+            if _CONSECUTIVE_OPS_RE.search(test_expr.replace('**', '')):
                 return False, "Operadores consecutivos no permitidos"
 
             return True, ""
@@ -408,50 +538,14 @@ class InputValidationMixin(RealTimeValidationMixin, AdvancedValidationMixin):
             entries: Campos de entrada
             validation_config: Configuración de validación por campo
         """
-        # Crear validadores basados en configuración
+        # Guardar referencia a los entries
+        self.entries = entries
+
+        # Crear validadores basados en configuración (tipos desconocidos: campo requerido)
         validators = {}
         for field_name, config in validation_config.items():
-            validator_type = config.get('type', 'text')
-            validator_params = config.get('params', {})
-
-            if validator_type == 'numeric':
-                validators[field_name] = lambda v, p=validator_params: self.validate_numeric(v, **p)
-            elif validator_type == 'integer':
-                validators[field_name] = lambda v, p=validator_params: self.validate_integer(v, **p)
-            elif validator_type == 'function':
-                validators[field_name] = self.validate_function
-            elif validator_type == 'positive':
-                validators[field_name] = self.validate_positive_number
-            elif validator_type == 'tolerance':
-                validators[field_name] = self.validate_tolerance
-            else:
-                validators[field_name] = lambda v: (bool(v.strip()), "Campo requerido" if not v.strip() else "")
+            builder = _VALIDATOR_BUILDERS.get(config.get('type', 'text'), _build_required_validator)
+            validators[field_name] = builder(self, config.get('params', {}))
 
         # Configurar validación en tiempo real
         self.setup_realtime_validation(entries, validators)
-
-    def validate_range(self, start_value: str, end_value: str,
-                      start_label: str = "límite inferior",
-                      end_label: str = "límite superior") -> tuple[bool, str]:
-        """
-        Valida que el rango sea correcto (inicio < fin).
-
-        Args:
-            start_value: Valor del límite inferior
-            end_value: Valor del límite superior
-            start_label: Etiqueta para el límite inferior
-            end_label: Etiqueta para el límite superior
-
-        Returns:
-            Tupla (is_valid, error_message)
-        """
-        try:
-            start = float(start_value)
-            end = float(end_value)
-
-            if start >= end:
-                return False, f"El {start_label} debe ser menor que el {end_label}"
-
-            return True, ""
-        except ValueError:
-            return False, "Los valores del rango deben ser números válidos"
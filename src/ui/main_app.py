@@ -9,10 +9,6 @@ import customtkinter as ctk
 import logging
 from typing import Dict, Any
 
-from src.ui.tabs.roots_tab import RootsTab
-from src.ui.tabs.ode_tab_new import ODETab
-from src.ui.tabs.finite_diff_tab import FiniteDiffTab
-from src.ui.tabs.newton_cotes_tab import NewtonCotesTab
 from src.ui.components.tab_factory import TabFactory, create_placeholder_tab
 from src.ui.components.constants import VALIDATION, UI, PLOT, COLORS
 from config.settings import configure_matplotlib
@@ -20,6 +16,10 @@ from config.settings import configure_matplotlib
 
 logger = logging.getLogger(__name__)
 
+# Estilos de los botones de navegación, compartidos por todos los configure()
+_ACTIVE_BTN_STYLE = {"fg_color": ["#1f538d", "#3d8bff"], "text_color": "white"}
+_INACTIVE_BTN_STYLE = {"fg_color": ["gray75", "gray25"], "text_color": ["gray10", "gray90"]}
+
 
 class MathSimulatorApp(ctk.CTk):
     """Aplicación principal del simulador matemático"""
@@ -30,6 +30,13 @@ class MathSimulatorApp(ctk.CTk):
         # Configurar matplotlib
         configure_matplotlib()
 
+        # Fuentes compartidas por los widgets de la ventana principal
+        self._fonts = {
+            "title": ctk.CTkFont(size=24, weight="bold"),
+            "btn": ctk.CTkFont(size=14),
+            "small": ctk.CTkFont(size=12),
+        }
+
         # Configuración de la ventana - más grande para Newton-Cotes
         self.title("🧮 Simulador Matemático v4.0 - Modular")
         self.geometry(f"{UI.WINDOW_WIDTH}x{UI.WINDOW_HEIGHT}")
@@ -56,7 +63,7 @@ class MathSimulatorApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             self.sidebar,
             text="SIMULADOR",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self._fonts["title"],
             text_color=["#1f538d", "#3d8bff"]
         )
         title_label.grid(row=0, column=0, pady=(25, 35), padx=20)
@@ -80,7 +87,9 @@ class MathSimulatorApp(ctk.CTk):
                 command=lambda k=key: self.show_tab(k),
                 height=40,
                 anchor="w",
-                font=ctk.CTkFont(size=14)
+                font=self._fonts["btn"],
+                # Estilo inactivo desde el inicio: show_tab solo cambia el botón saliente y el entrante
+                **_INACTIVE_BTN_STYLE
             )
             btn.grid(row=i+1, column=0, pady=4, padx=20, sticky="ew")
             self.nav_buttons[key] = btn
@@ -89,7 +98,7 @@ class MathSimulatorApp(ctk.CTk):
         dev_label = ctk.CTkLabel(
             self.sidebar,
             text="Simulador Modular \nMetodos Numéricos",
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["small"],
             text_color=["gray60", "gray50"]
         )
         dev_label.grid(row=9, column=0, pady=10, padx=20)
@@ -101,14 +110,14 @@ class MathSimulatorApp(ctk.CTk):
         self.main_frame.grid_rowconfigure(0, weight=1)
         self.main_frame.grid_columnconfigure(0, weight=1)
 
-        # Inicializar diccionario de pestañas (lazy loading)
-        self.tabs = {}
+        # Inicializar pestañas (lazy loading)
+        self._active_tab = None  # Pestaña visible actualmente
         self._tab_cache = {}  # Cache para pestañas ya creadas
 
     def _get_tab(self, tab_id: str):
         """Obtener pestaña con lazy loading"""
         if tab_id not in self._tab_cache:
-            if tab_id in TabFactory.get_available_tabs():
+            if TabFactory.is_registered(tab_id):
                 # Crear pestaña usando factory
                 self._tab_cache[tab_id] = TabFactory.create_tab(tab_id, self.main_frame)
             elif tab_id in ["interpolation", "derivatives"]:
@@ -128,34 +137,33 @@ class MathSimulatorApp(ctk.CTk):
 
     def show_tab(self, tab_id):
         """Mostrar pestaña específica con lazy loading"""
-        # Ocultar todas las pestañas visibles
-        for tab in self.tabs.values():
-            if tab is not None:
-                tab.grid_remove()
+        # Volver a seleccionar la pestaña activa no requiere cambios
+        if tab_id == self._active_tab:
+            return
 
-        # Limpiar diccionario de pestañas visibles
-        self.tabs.clear()
-
-        # Obtener y mostrar la pestaña seleccionada
+        # Obtener la pestaña seleccionada antes de tocar la saliente: si su
+        # creación falla, la pestaña actual sigue visible y activa
         selected_tab = self._get_tab(tab_id)
+
+        # Ocultar solo la pestaña saliente y desmarcar su botón
+        if self._active_tab is not None:
+            previous_tab = self._tab_cache.get(self._active_tab)
+            if previous_tab is not None:
+                previous_tab.grid_remove()
+
+            previous_btn = self.nav_buttons.get(self._active_tab)
+            if previous_btn is not None:
+                previous_btn.configure(**_INACTIVE_BTN_STYLE)
+
+        # Mostrar la pestaña seleccionada
         if selected_tab is not None:
-            self.tabs[tab_id] = selected_tab
             selected_tab.grid(row=0, column=0, sticky="nsew")
 
-        # Actualizar apariencia de los botones
-        for btn_id, btn in self.nav_buttons.items():
-            if btn_id == tab_id:
-                # Botón activo
-                btn.configure(
-                    fg_color=["#1f538d", "#3d8bff"],
-                    text_color="white"
-                )
-            else:
-                # Botón inactivo
-                btn.configure(
-                    fg_color=["gray75", "gray25"],
-                    text_color=["gray10", "gray90"]
-                )
+        selected_btn = self.nav_buttons.get(tab_id)
+        if selected_btn is not None:
+            selected_btn.configure(**_ACTIVE_BTN_STYLE)
+
+        self._active_tab = tab_id
 
     def show_error(self, message):
         """Mostrar mensaje de error"""
@@ -168,7 +176,7 @@ class MathSimulatorApp(ctk.CTk):
             error_window,
             text=message,
             wraplength=350,
-            font=ctk.CTkFont(size=12)
+            font=self._fonts["small"]
         )
         error_label.pack(pady=20, padx=20)
 
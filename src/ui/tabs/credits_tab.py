@@ -9,6 +9,22 @@ import customtkinter as ctk
 from src.ui.components.base_tab import BaseTab
 
 
+# Lista de integrantes (placeholders - reemplazar con nombres reales)
+TEAM_MEMBERS = (
+    "Federico Muntaabski",
+    "Nicolas Llousas",
+    "Sebastian Prior",
+    "Santiago Oteiza",
+)
+
+
+def _create_centered_label(parent, row: int, text: str, font, pady, **label_kwargs):
+    """Crear un label centrado en la fila indicada"""
+    label = ctk.CTkLabel(parent, text=text, font=font, anchor="center", **label_kwargs)
+    label.grid(row=row, column=0, pady=pady, sticky="ew")
+    return label
+
+
 class CreditsTab(BaseTab):
     """
     Pestaña que muestra los créditos del proyecto.
@@ -21,49 +37,34 @@ class CreditsTab(BaseTab):
         """
         Crear el contenido de la pestaña de créditos.
         """
+        # Fuentes creadas una sola vez y reutilizadas por cada label
+        title_font = ctk.CTkFont(size=24, weight="bold")
+        member_font = ctk.CTkFont(size=18)
+        info_font = ctk.CTkFont(size=16)
+
         # Frame para los créditos
         credits_frame = ctk.CTkFrame(self.content_frame)
         credits_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         credits_frame.grid_columnconfigure(0, weight=1)
 
         # Título de créditos
-        title_label = ctk.CTkLabel(
-            credits_frame,
-            text="👥 Integrantes del Equipo",
-            font=ctk.CTkFont(size=24, weight="bold")
+        _create_centered_label(
+            credits_frame, 0, "👥 Integrantes del Equipo",
+            title_font, pady=(20, 30)
         )
-        title_label.grid(row=0, column=0, pady=(20, 30), sticky="ew")
-        title_label.configure(anchor="center")  # Centrar el título
-
-        # Lista de integrantes (placeholders - reemplazar con nombres reales)
-        team_members = [
-            "Federico Muntaabski",
-            "Nicolas Llousas",
-            "Sebastian Prior",
-            "Santiago Oteiza"
-        ]
-
-        for i, member in enumerate(team_members):
-            member_label = ctk.CTkLabel(
-                credits_frame,
-                text=member,  # Quitar el punto para mejor centrado
-                font=ctk.CTkFont(size=18)
-            )
-            member_label.grid(row=i+1, column=0, pady=10, sticky="ew")  # Aumentar padding vertical
-            member_label.configure(anchor="center")  # Centrar el texto dentro del label
 
-        # Espacio adicional
-        spacer = ctk.CTkLabel(credits_frame, text="")
-        spacer.grid(row=len(team_members)+1, column=0, pady=20)
+        # Integrantes, todos con la misma fuente
+        for i, member in enumerate(TEAM_MEMBERS, 1):
+            _create_centered_label(credits_frame, i, member, member_font, pady=10)
 
-        # Información adicional
-        info_label = ctk.CTkLabel(
+        # Información adicional; el margen superior reemplaza al label espaciador
+        _create_centered_label(
             credits_frame,
-            text="Proyecto: Simulador Matemático \n"
-                 "Materia: Modelado y Simulación\n"
-                 "Año: 2025\n",
-            font=ctk.CTkFont(size=16),
+            len(TEAM_MEMBERS) + 1,
+            "Proyecto: Simulador Matemático \n"
+            "Materia: Modelado y Simulación\n"
+            "Año: 2025\n",
+            info_font,
+            pady=(70, 20),
             text_color=["gray60", "gray50"]
         )
-        info_label.grid(row=len(team_members)+2, column=0, pady=(10, 20), sticky="ew")
-        info_label.configure(anchor="center")  # Centrar la información adicional
@@ -6,15 +6,143 @@ Solo entrada por lista de puntos con área de resultados expandible.
 
 import customtkinter as ctk
 import numpy as np
+import threading
+from collections import Counter
+from functools import cached_property
+from itertools import zip_longest
 from typing import Optional, List, Dict
 
 from src.ui.components.base_tab import BaseTab
 from src.ui.components.mixins import InputValidationMixin, ResultDisplayMixin, PlottingMixin
-from src.core.finite_differences import FiniteDifferences
 from config.settings import NUMERICAL_CONFIG
 from src.ui.components.constants import VALIDATION, UI, PLOT, COLORS
 
 
+# Filas de la tabla de entrada y valores por defecto de las primeras
+POINT_ROWS = 6
+DEFAULT_POINTS = (
+    ("1.0", "3.0"),
+    ("1.1", "3.651"),
+    ("1.2", "4.448"),
+    ("1.3", "5.403"),
+)
+
+# Fragmentos de texto insertados por lote en el área de resultados; el resto
+# se inserta en llamadas after_idle para que la interfaz se repinte entre lotes
+RESULTS_BATCH_SIZE = 10
+
+# Separadores del texto de resultados
+_SEP60 = "=" * 60
+_SEP50 = "=" * 50
+_SEP30 = "-" * 30
+
+# Bloque de texto de cada punto en los resultados. Las secciones opcionales
+# (justificación, evaluaciones y sustitución) llegan ya formateadas con su
+# salto de línea inicial, o vacías si no aplican. Los separadores se fijan al
+# definir la plantilla; los campos de str.format van con llaves dobles.
+POINT_TEMPLATE = f"""{_SEP50}
+📍 PUNTO {{i}}: x = {{x}}
+{_SEP50}
+🔸 Método seleccionado: {{method_title}}
+   Fórmula: {{formula}}
+   Error de truncamiento: {{error_order}}{{justification}}
+
+📝 PROCESO DE CÁLCULO:
+{_SEP30}{{evaluations}}
+
+🧮 SUSTITUCIÓN EN FÓRMULA:{{substitution}}
+
+🎯 RESULTADO FINAL:
+   f'({{x}}) ≈ {{derivative:.8f}}
+
+📊 ANÁLISIS DE ERROR:
+   Error de truncamiento: {{error_order}}
+   Precisión: {{precision}}
+   Error local estimado: ≈ {{estimated_error:.6f}}
+"""
+
+# Nombre mostrado de cada método (evita un str.title() por punto)
+_METHOD_DISPLAY = {
+    "progressive": "Progressive",
+    "regressive": "Regressive",
+    "central": "Central",
+    "unknown": "Unknown",
+}
+
+
+def _result_method(result: Dict) -> str:
+    """Método usado en un resultado (el seleccionado automáticamente si existe)"""
+    return result.get('auto_selected_method') or result.get('method') or 'unknown'
+
+
+def _method_title(method: str) -> str:
+    """Nombre de un método para mostrar en los resultados"""
+    return _METHOD_DISPLAY.get(method) or method.title()
+
+
+def _iter_point_contexts(results: List[Dict], h: float):
+    """Generar los valores ya formateados de POINT_TEMPLATE para cada punto"""
+    for i, result in enumerate(results, 1):
+        x = result['x']
+        method = _result_method(result)
+        error_order = result.get('error_order', 'N/A')
+        
+        # Justificación de selección automática
+        justification = ""
+        if 'position_in_list' in result:
+            pos = result['position_in_list'] + 1
+            if pos == 1:
+                justification = "\n   Justificación: Primer punto → Método progresivo"
+            elif pos == result['total_points']:
+                justification = "\n   Justificación: Último punto → Método regresivo"
+            else:
+                justification = "\n   Justificación: Punto intermedio → Método central (mayor precisión)"
+        
+        # Evaluaciones de función
+        evaluations = []
+        if 'fx_minus_h' in result:
+            evaluations.append(f"\n   f({x - h:.3f}) = {result['fx_minus_h']:.6f}")
+        if 'fx' in result:
+            evaluations.append(f"\n   f({x:.3f}) = {result['fx']:.6f}")
+        if 'fx_plus_h' in result:
+            evaluations.append(f"\n   f({x + h:.3f}) = {result['fx_plus_h']:.6f}")
+        
+        # Sustitución en fórmula
+        if method == 'progressive':
+            substitution = (f"\n   f'({x}) ≈ [{result['fx_plus_h']:.6f} - {result['fx']:.6f}] / {h}"
+                            f"\n   f'({x}) ≈ {result['numerator']:.6f} / {result['denominator']}")
+        elif method == 'regressive':
+            substitution = (f"\n   f'({x}) ≈ [{result['fx']:.6f} - {result['fx_minus_h']:.6f}] / {h}"
+                            f"\n   f'({x}) ≈ {result['numerator']:.6f} / {result['denominator']}")
+        elif method == 'central':
+            substitution = (f"\n   f'({x}) ≈ [{result['fx_plus_h']:.6f} - {result['fx_minus_h']:.6f}] / (2 × {h})"
+                            f"\n   f'({x}) ≈ {result['numerator']:.6f} / {result['denominator']}")
+        else:
+            substitution = ""
+        
+        # Análisis de error
+        if error_order == 'O(h²)':
+            precision = "ALTA (error cuadrático)"
+            estimated_error = h**2
+        else:
+            precision = "MEDIA (error lineal)"
+            estimated_error = h
+        
+        yield {
+            "i": i,
+            "x": x,
+            "method_title": _method_title(method),
+            "formula": result.get('formula', 'N/A'),
+            "error_order": error_order,
+            "justification": justification,
+            "evaluations": "".join(evaluations),
+            "substitution": substitution,
+            "derivative": result['derivative'],
+            "precision": precision,
+            "estimated_error": estimated_error,
+        }
+
+
 class FiniteDiffTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin):
     """
     Pestaña para diferencias finitas simplificada.
@@ -23,8 +151,22 @@ class FiniteDiffTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingM
     
     def __init__(self, parent):
         super().__init__(parent, "🔢 Diferencias Finitas")
-        self.calculator = FiniteDifferences()
         self.data_points = []
+        # Última entrada calculada y su texto, para no recalcular ni reformatear
+        # cuando se pulsa "Calcular" varias veces con los mismos datos
+        self._last_key = None
+        self._last_text = None
+        # Identifica la escritura en curso del área de resultados; los lotes
+        # pendientes de una escritura anterior se descartan
+        self._render_token = 0
+        # Hilo de cálculo en curso (None si no hay ninguno)
+        self._calc_worker = None
+    
+    @cached_property
+    def calculator(self):
+        """Calculador de diferencias finitas, creado en el primer cálculo"""
+        from src.core.finite_differences import FiniteDifferences
+        return FiniteDifferences()
     
     def create_content(self):
         """Crear contenido específico para diferencias finitas"""
@@ -61,6 +203,7 @@ class FiniteDiffTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingM
         self.h_entry = ctk.CTkEntry(input_frame, width=100)
         self.h_entry.grid(row=0, column=1, padx=10, pady=5, sticky="w")
         self.h_entry.insert(0, "0.1")
+        self.h_entry.bind("<Return>", self._on_enter)
         
         # Tabla para entrada de puntos
         table_label = ctk.CTkLabel(
@@ -82,32 +225,25 @@ class FiniteDiffTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingM
             row=0, column=1, padx=5, pady=2
         )
         
-        # Crear entradas para puntos
+        # Crear entradas para puntos con sus valores por defecto en una sola pasada
         self.point_entries = []
-        for i in range(6):  # 6 filas por defecto
+        for i, (x_val, fx_val) in zip_longest(range(POINT_ROWS), DEFAULT_POINTS, fillvalue=("", "")):
             x_entry = ctk.CTkEntry(self.table_frame, width=80)
             fx_entry = ctk.CTkEntry(self.table_frame, width=80)
             
             x_entry.grid(row=i+1, column=0, padx=5, pady=2)
             fx_entry.grid(row=i+1, column=1, padx=5, pady=2)
             
+            if x_val:
+                x_entry.insert(0, x_val)
+                fx_entry.insert(0, fx_val)
+            
+            x_entry.bind("<Return>", self._on_enter)
+            fx_entry.bind("<Return>", self._on_enter)
             self.point_entries.append((x_entry, fx_entry))
         
-        # Valores por defecto
-        default_points = [
-            ("1.0", "3.0"),
-            ("1.1", "3.651"),
-            ("1.2", "4.448"),
-            ("1.3", "5.403")
-        ]
-        
-        for i, (x_val, fx_val) in enumerate(default_points):
-            if i < len(self.point_entries):
-                self.point_entries[i][0].insert(0, x_val)
-                self.point_entries[i][1].insert(0, fx_val)
-        
         # Botón de cálculo
-        calculate_btn = ctk.CTkButton(
+        self.calculate_btn = ctk.CTkButton(
             input_frame,
             text="🧮 Calcular Diferencias Finitas",
             command=self.calculate_list_mode,
@@ -115,7 +251,11 @@ class FiniteDiffTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingM
             height=40,
             width=250
         )
-        calculate_btn.grid(row=3, column=0, columnspan=3, pady=15, padx=10)
+        self.calculate_btn.grid(row=3, column=0, columnspan=3, pady=15, padx=10)
+
+    def _on_enter(self, event=None):
+        """Calcular al presionar Enter, después de que Tk termine de procesar la tecla"""
+        self.after_idle(self.calculate_list_mode)
 
     def create_large_results_section(self):
         """Crear sección de resultados expandible y grande"""
@@ -161,6 +301,10 @@ Los resultados mostrarán explicaciones paso a paso del proceso de cálculo."""
 
     def calculate_list_mode(self):
         """Ejecutar cálculo en modo lista"""
+        # Ya hay un cálculo en curso: se ignora el nuevo pedido
+        if self._calc_worker is not None:
+            return
+        
         try:
             # Validar paso h usando el nuevo sistema
             h_text = self.h_entry.get().strip()
@@ -180,47 +324,94 @@ Los resultados mostrarán explicaciones paso a paso del proceso de cálculo."""
                 self.show_error("El paso h debe ser un número válido")
                 return
             
-            # Recopilar puntos válidos
-            data_points = []
+            # Recopilar las filas completas y convertirlas en una sola pasada
+            rows = []
+            pairs = []
             for i, (x_entry, fx_entry) in enumerate(self.point_entries):
                 x_text = x_entry.get().strip()
                 fx_text = fx_entry.get().strip()
-                
                 if x_text and fx_text:  # Solo procesar si ambos campos tienen datos
+                    rows.append(i)
+                    pairs.append((x_text, fx_text))
+            
+            try:
+                values = np.array(pairs, dtype=float).reshape(-1, 2)
+            except ValueError:
+                # Solo en el caso de error se busca la fila culpable
+                for i, pair in zip(rows, pairs):
                     try:
-                        x = float(x_text)
-                        fx = float(fx_text)
-                        
-                        # Validar rangos usando constantes
-                        if x < VALIDATION.MIN_X_VALUE or x > VALIDATION.MAX_X_VALUE:
-                            self.show_error(f"Punto {i+1}: x debe estar entre {VALIDATION.MIN_X_VALUE} y {VALIDATION.MAX_X_VALUE}")
-                            return
-                        if fx < VALIDATION.MIN_Y_VALUE or fx > VALIDATION.MAX_Y_VALUE:
-                            self.show_error(f"Punto {i+1}: f(x) debe estar entre {VALIDATION.MIN_Y_VALUE} y {VALIDATION.MAX_Y_VALUE}")
-                            return
-                        
-                        data_points.append({
-                            "x": x,
-                            "h": h,
-                            "fx": fx
-                        })
+                        np.array(pair, dtype=float)
                     except ValueError:
                         self.show_error(f"Punto {i+1}: valores numéricos inválidos")
                         return
+                raise
+            x_values = values[:, 0]
+            fx_values = values[:, 1]
             
-            if len(data_points) < VALIDATION.MIN_POINTS:
+            # Validar rangos usando constantes (se informa la primera fila inválida)
+            bad_x = (x_values < VALIDATION.MIN_X_VALUE) | (x_values > VALIDATION.MAX_X_VALUE)
+            bad_fx = (fx_values < VALIDATION.MIN_Y_VALUE) | (fx_values > VALIDATION.MAX_Y_VALUE)
+            invalid = np.flatnonzero(bad_x | bad_fx)
+            if invalid.size:
+                j = invalid[0]
+                if bad_x[j]:
+                    self.show_error(f"Punto {rows[j]+1}: x debe estar entre {VALIDATION.MIN_X_VALUE} y {VALIDATION.MAX_X_VALUE}")
+                else:
+                    self.show_error(f"Punto {rows[j]+1}: f(x) debe estar entre {VALIDATION.MIN_Y_VALUE} y {VALIDATION.MAX_Y_VALUE}")
+                return
+            
+            if len(x_values) < VALIDATION.MIN_POINTS:
                 self.show_error(f"Se necesitan al menos {VALIDATION.MIN_POINTS} puntos para calcular diferencias finitas")
                 return
             
-            # Calcular usando auto_calculate_list
-            results = self.calculator.auto_calculate_list(data_points)
+            # Misma entrada que el último cálculo: reutilizar el texto ya generado
+            key = (h, tuple(x_values.tolist()), tuple(fx_values.tolist()))
+            if key == self._last_key:
+                self._set_results_text([self._last_text])
+                return
+            
+            # El cálculo y el formateo no tocan widgets: se ejecutan fuera del
+            # hilo de Tk y el texto se instala desde el hilo principal
+            calculator = self.calculator
+            outcome = {}
+            
+            def compute():
+                try:
+                    # Calcular todos los puntos de una vez sobre arreglos
+                    results = calculator.auto_calculate_list_vec(x_values, fx_values, h)
+                    outcome["output"] = self._build_results_output(results, h)
+                except Exception as e:
+                    outcome["error"] = e
             
-            # Mostrar resultados mejorados
-            self._display_improved_results(results, h, manual_mode=False)
+            self.calculate_btn.configure(state="disabled")
+            self._calc_worker = threading.Thread(target=compute, daemon=True)
+            self._calc_worker.start()
+            self.after(20, self._apply_calculation, key, outcome)
             
         except Exception as e:
             self.show_error(f"Error en cálculo: {e}")
 
+    def _apply_calculation(self, key, outcome: Dict):
+        """Mostrar el resultado del hilo de cálculo cuando esté listo"""
+        # La pestaña (o la ventana) se destruyó durante el cálculo
+        if not self.winfo_exists():
+            return
+        if self._calc_worker.is_alive():
+            self.after(20, self._apply_calculation, key, outcome)
+            return
+        
+        self._calc_worker = None
+        self.calculate_btn.configure(state="normal")
+        
+        if "error" in outcome:
+            self.show_error(f"Error en cálculo: {outcome['error']}")
+            return
+        
+        # Mostrar resultados mejorados
+        self._set_results_text(outcome["output"])
+        self._last_text = "\n".join(outcome["output"])
+        self._last_key = key
+
     # Métodos heredados de BaseTab - mantener para compatibilidad
     def progressive_method(self):
         """Método progresivo - ahora redirige al cálculo principal"""
@@ -243,12 +434,20 @@ Los resultados mostrarán explicaciones paso a paso del proceso de cálculo."""
         self.calculate_list_mode()
 
     def _display_improved_results(self, results, h, manual_mode=False, function_str=None):
-        """Mostrar resultados mejorados con explicaciones paso a paso"""
-        self.results_text.delete("1.0", "end")
-        
+        """Mostrar resultados mejorados con explicaciones paso a paso.
+
+        Devuelve el texto mostrado para que pueda reutilizarse.
+        """
+        output = self._build_results_output(results, h, manual_mode, function_str)
+        self._set_results_text(output)
+        return "\n".join(output)
+
+    @staticmethod
+    def _build_results_output(results, h, manual_mode=False, function_str=None) -> List[str]:
+        """Armar los fragmentos del texto de resultados (sin tocar widgets)"""
         output = []
         output.append("🎯 RESULTADOS DIFERENCIAS FINITAS")
-        output.append("=" * 60)
+        output.append(_SEP60)
         output.append("")
         
         if manual_mode and function_str:
@@ -259,94 +458,23 @@ Los resultados mostrarán explicaciones paso a paso del proceso de cálculo."""
         output.append("")
         
         # Estadísticas de métodos
-        methods_count = {}
-        for result in results:
-            method = result.get('auto_selected_method', result.get('method', 'unknown'))
-            methods_count[method] = methods_count.get(method, 0) + 1
+        methods_count = Counter(map(_result_method, results))
         
         output.append("🔧 MÉTODOS UTILIZADOS:")
         for method, count in methods_count.items():
-            output.append(f"   • {method.title()}: {count} vez(es)")
+            output.append(f"   • {_method_title(method)}: {count} vez(es)")
         output.append("")
         
         # Resultados detallados para cada punto
-        for i, result in enumerate(results, 1):
-            output.append(f"{'='*50}")
-            output.append(f"📍 PUNTO {i}: x = {result['x']}")
-            output.append(f"{'='*50}")
-            
-            # Información del método
-            method = result.get('auto_selected_method', result.get('method', 'unknown'))
-            output.append(f"🔸 Método seleccionado: {method.title()}")
-            output.append(f"   Fórmula: {result.get('formula', 'N/A')}")
-            output.append(f"   Error de truncamiento: {result.get('error_order', 'N/A')}")
-            
-            # Justificación de selección automática
-            if 'position_in_list' in result:
-                pos = result['position_in_list'] + 1
-                total = result['total_points']
-                if pos == 1:
-                    justification = "Primer punto → Método progresivo"
-                elif pos == total:
-                    justification = "Último punto → Método regresivo"
-                else:
-                    justification = "Punto intermedio → Método central (mayor precisión)"
-                output.append(f"   Justificación: {justification}")
-            
-            output.append("")
-            
-            # Proceso de cálculo
-            output.append("📝 PROCESO DE CÁLCULO:")
-            output.append("-" * 30)
-            
-            # Evaluaciones de función
-            if 'fx_minus_h' in result:
-                output.append(f"   f({result['x'] - h:.3f}) = {result['fx_minus_h']:.6f}")
-            if 'fx' in result:
-                output.append(f"   f({result['x']:.3f}) = {result['fx']:.6f}")
-            if 'fx_plus_h' in result:
-                output.append(f"   f({result['x'] + h:.3f}) = {result['fx_plus_h']:.6f}")
-            
-            output.append("")
-            
-            # Sustitución en fórmula
-            output.append("🧮 SUSTITUCIÓN EN FÓRMULA:")
-            if method == 'progressive':
-                output.append(f"   f'({result['x']}) ≈ [{result['fx_plus_h']:.6f} - {result['fx']:.6f}] / {h}")
-                output.append(f"   f'({result['x']}) ≈ {result['fx_plus_h'] - result['fx']:.6f} / {h}")
-            elif method == 'regressive':
-                output.append(f"   f'({result['x']}) ≈ [{result['fx']:.6f} - {result['fx_minus_h']:.6f}] / {h}")
-                output.append(f"   f'({result['x']}) ≈ {result['fx'] - result['fx_minus_h']:.6f} / {h}")
-            elif method == 'central':
-                output.append(f"   f'({result['x']}) ≈ [{result['fx_plus_h']:.6f} - {result['fx_minus_h']:.6f}] / (2 × {h})")
-                output.append(f"   f'({result['x']}) ≈ {result['fx_plus_h'] - result['fx_minus_h']:.6f} / {2 * h}")
-            
-            output.append("")
-            
-            # Resultado final
-            output.append("🎯 RESULTADO FINAL:")
-            output.append(f"   f'({result['x']}) ≈ {result['derivative']:.8f}")
-            
-            # Análisis de error
-            output.append("")
-            output.append("📊 ANÁLISIS DE ERROR:")
-            error_order = result.get('error_order', 'N/A')
-            if error_order == 'O(h²)':
-                precision = "ALTA (error cuadrático)"
-                estimated_error = h**2
-            else:
-                precision = "MEDIA (error lineal)"
-                estimated_error = h
-            
-            output.append(f"   Error de truncamiento: {error_order}")
-            output.append(f"   Precisión: {precision}")
-            output.append(f"   Error local estimado: ≈ {estimated_error:.6f}")
-            output.append("")
+        output.extend(
+            POINT_TEMPLATE.format(**ctx)
+            for ctx in _iter_point_contexts(results, h)
+        )
         
         # Resumen final
-        output.append("="*60)
+        output.append(_SEP60)
         output.append("📈 RESUMEN GENERAL")
-        output.append("="*60)
+        output.append(_SEP60)
         output.append(f"✅ Procesamiento completado exitosamente")
         output.append(f"📊 {len(results)} derivadas calculadas")
         output.append(f"🎯 Paso común utilizado: h = {h}")
@@ -359,12 +487,28 @@ Los resultados mostrarán explicaciones paso a paso del proceso de cálculo."""
         output.append("   • Para mayor precisión, reduzca el valor de h")
         output.append("   • Para puntos extremos, considere agregar más datos")
         
-        # Mostrar en el widget de texto
-        result_text = "\n".join(output)
-        self.results_text.insert("1.0", result_text)
+        return output
+
+    def _set_results_text(self, chunks: List[str]):
+        """Reemplazar el texto de resultados insertando los fragmentos por lotes"""
+        self._render_token += 1
+        self.results_text.delete("1.0", "end")
+        self._insert_results_batch(chunks, 0, self._render_token)
+
+    def _insert_results_batch(self, chunks: List[str], start: int, token: int):
+        """Insertar un lote de fragmentos y programar el siguiente"""
+        if token != self._render_token:
+            return
+        end = start + RESULTS_BATCH_SIZE
+        if end < len(chunks):
+            self.results_text.insert("end", "\n".join(chunks[start:end]) + "\n")
+            self.after_idle(self._insert_results_batch, chunks, end, token)
+        else:
+            self.results_text.insert("end", "\n".join(chunks[start:]))
 
     def show_error(self, message):
         """Mostrar mensaje de error en el área de resultados"""
+        self._render_token += 1
         self.results_text.delete("1.0", "end")
         error_msg = f"❌ ERROR\n\n{message}\n\nPor favor, corrija los datos e intente nuevamente."
         self.results_text.insert("1.0", error_msg)
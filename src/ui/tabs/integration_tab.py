@@ -14,7 +14,6 @@ from src.ui.components.base_tab import BaseTab
 from src.ui.components.mixins import InputValidationMixin, ResultDisplayMixin, PlottingMixin
 from src.ui.components.constants import VALIDATION, DEFAULT_CONFIGS
 from src.core.integration import NumericalIntegrator
-from src.core.root_finding import create_function_from_string
 from config.settings import NUMERICAL_CONFIG
 
 
@@ -101,7 +100,7 @@ class IntegrationTab(BaseTab, InputValidationMixin, ResultDisplayMixin, Plotting
                 return
 
             # Crear función
-            f = create_function_from_string(function_str)
+            f = self._compile_expr(function_str)
 
             # Ejecutar método
             result = self.integrator.trapezoid_rule(
@@ -140,7 +139,7 @@ class IntegrationTab(BaseTab, InputValidationMixin, ResultDisplayMixin, Plotting
                 return
 
             # Crear función
-            f = create_function_from_string(function_str)
+            f = self._compile_expr(function_str)
 
             # Ejecutar método
             result = self.integrator.simpson_13_rule(
@@ -179,7 +178,7 @@ class IntegrationTab(BaseTab, InputValidationMixin, ResultDisplayMixin, Plotting
                 return
 
             # Crear función
-            f = create_function_from_string(function_str)
+            f = self._compile_expr(function_str)
 
             # Ejecutar método
             result = self.integrator.simpson_38_rule(
@@ -218,7 +217,7 @@ class IntegrationTab(BaseTab, InputValidationMixin, ResultDisplayMixin, Plotting
                 return
 
             # Crear función
-            f = create_function_from_string(function_str)
+            f = self._compile_expr(function_str)
 
             # Ejecutar todos los métodos
             results = {}
@@ -11,9 +11,9 @@ import numpy as np
 from typing import Optional
 
 from src.ui.components.base_tab import BaseTab
-from src.ui.components.mixins import InputValidationMixin, ResultDisplayMixin, PlottingMixin
-from src.ui.components.constants import VALIDATION, DEFAULT_CONFIGS
-from src.core.root_finding import RootFinder, create_function_from_string
+from src.ui.components.mixins import InputValidationMixin, ResultDisplayMixin, PlottingMixin, check_function_syntax
+from src.ui.components.constants import VALIDATION, get_default_config
+from src.core.root_finding import RootFinder
 from config.settings import NUMERICAL_CONFIG
 
 
@@ -87,7 +87,7 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
         self._validation_callbacks = {}
         self._field_validators = {}
         
-        config = DEFAULT_CONFIGS["root_finding"]
+        config = get_default_config("root_finding")
         self.root_finder = RootFinder(
             tolerance=config["tolerance"],
             max_iterations=config["max_iterations"]
@@ -294,6 +294,11 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
                 if not func_text:
                     field_name = "función" if "función" in field else "derivada"
                     errors[field] = f"La {field_name} no puede estar vacía"
+                else:
+                    # Sintaxis con lista blanca (resultado cacheado por texto)
+                    syntax_error = check_function_syntax(func_text)
+                    if syntax_error:
+                        errors[field] = syntax_error
         
         # Validar intervalo a (para bisección)
         if "intervalo_a" in self.entries:
@@ -420,7 +425,7 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
                 return
 
             # Crear función
-            f = create_function_from_string(function_str)
+            f = self._compile_expr(function_str)
 
             # Crear instancia de RootFinder con los parámetros especificados
             root_finder = RootFinder(
@@ -458,8 +463,8 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
             derivative_str = values["derivada_df"]
 
             # Crear funciones
-            f = create_function_from_string(function_str)
-            df = create_function_from_string(derivative_str)
+            f = self._compile_expr(function_str)
+            df = self._compile_expr(derivative_str)
 
             # Crear instancia de RootFinder con los parámetros especificados
             root_finder = RootFinder(
@@ -496,7 +501,7 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
             function_str = values["función_g"]
 
             # Crear función de iteración g(x)
-            g = create_function_from_string(function_str)
+            g = self._compile_expr(function_str)
 
             # Crear instancia de RootFinder con los parámetros especificados
             root_finder = RootFinder(
@@ -531,7 +536,7 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
             function_str = values["función_g"]
 
             # Crear función de iteración g(x)
-            g = create_function_from_string(function_str)
+            g = self._compile_expr(function_str)
 
             # Crear instancia de RootFinder con los parámetros especificados
             root_finder = RootFinder(
@@ -566,7 +571,7 @@ class RootsTab(BaseTab, InputValidationMixin, ResultDisplayMixin, PlottingMixin)
             function_str = values["función_f"]
 
             # Crear función
-            f = create_function_from_string(function_str)
+            f = self._compile_expr(function_str)
 
             # Crear instancia de RootFinder con los parámetros especificados
             root_finder = RootFinder(
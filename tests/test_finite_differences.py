@@ -408,6 +408,38 @@ class TestNewFiniteDifferences(unittest.TestCase):
             self.assertEqual(result['position_in_list'], i)
             self.assertEqual(result['total_points'], 4)
     
+    def test_auto_calculate_list_vec_matches_list(self):
+        """Test que la versión vectorizada coincide con auto_calculate_list"""
+        cases = {
+            "uniforme": [1.0, 1.1, 1.2, 1.3, 1.4],
+            "no uniforme": [0.0, 0.3, 0.45, 1.0, 1.7],
+            "un punto": [2.0],
+            "dos puntos": [1.0, 1.5],
+        }
+        for name, x_values in cases.items():
+            with self.subTest(caso=name):
+                fx_values = [x**3 for x in x_values]
+                data_points = [{"x": x, "h": 0.1, "fx": fx} for x, fx in zip(x_values, fx_values)]
+                
+                expected = self.calculator.auto_calculate_list(data_points)
+                results = self.calculator.auto_calculate_list_vec(x_values, fx_values, 0.1)
+                
+                self.assertEqual(len(results), len(expected))
+                for result, reference in zip(results, expected):
+                    self.assertEqual(result['auto_selected_method'], reference['auto_selected_method'])
+                    self.assertEqual(result.keys(), reference.keys())
+                    self.assertAlmostEqual(result['derivative'], reference['derivative'], places=10)
+        
+        # Valores x repetidos entre vecinos no permiten interpolar, en ambas versiones
+        for x_values in ([1.0, 1.0, 1.2], [1.0, 1.2, 1.2], [1.0, 1.0]):
+            with self.subTest(x_repetidos=x_values):
+                fx_values = [float(i) for i in range(1, len(x_values) + 1)]
+                data_points = [{"x": x, "h": 0.1, "fx": fx} for x, fx in zip(x_values, fx_values)]
+                with self.assertRaises(ValueError):
+                    self.calculator.auto_calculate_list(data_points)
+                with self.assertRaises(ValueError):
+                    self.calculator.auto_calculate_list_vec(x_values, fx_values, 0.1)
+    
     def test_validate_input_data(self):
         """Test validación de datos de entrada"""
         # Datos válidos
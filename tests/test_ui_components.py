@@ -0,0 +1,216 @@
+"""
+Tests unitarios para los componentes compartidos de la interfaz.
+
+Verifica la lógica que no depende de widgets: conversión de errores,
+validación de expresiones y formateo de resultados.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+
+# Agregar el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.ui.components.error_handler import error_handler, _ERROR_MAPPINGS
+from src.ui.components.constants import ALLOWED_CHARS, is_valid_expr
+from src.ui.components.mixins import (
+    InputValidationMixin, PlottingMixin, format_decimal_number, format_iteration_matrix
+)
+
+
+class FakeEntry:
+    """Entrada mínima con la interfaz get() de CTkEntry"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def get(self):
+        return self.text
+
+
+class TestErrorMessages(unittest.TestCase):
+    """Tests para la conversión de errores técnicos a mensajes de usuario"""
+
+    def convert(self, error_str, context=""):
+        return error_handler._convert_to_user_message(error_str, context)
+
+    def test_single_term(self):
+        """Test que cada término conocido devuelve su mensaje"""
+        for term, message in _ERROR_MAPPINGS.items():
+            with self.subTest(term=term):
+                self.assertEqual(self.convert(f"ValueError: {term}"), message)
+
+    def test_case_insensitive(self):
+        """Test que la búsqueda no distingue mayúsculas"""
+        self.assertEqual(self.convert("NameError: name 'q' is not defined"),
+                         _ERROR_MAPPINGS["nameerror"])
+        self.assertEqual(self.convert("FLOAT DIVISION BY ZERO"),
+                         _ERROR_MAPPINGS["division by zero"])
+
+    def test_priority_follows_mapping_order(self):
+        """Test que con varios términos gana el primero de _ERROR_MAPPINGS, no el primero del texto"""
+        self.assertEqual(self.convert("overflow encountered, then float division by zero"),
+                         _ERROR_MAPPINGS["division by zero"])
+        self.assertEqual(self.convert("max iterations reached: no convergence"),
+                         _ERROR_MAPPINGS["convergence"])
+        self.assertEqual(self.convert("underflow and overflow"),
+                         _ERROR_MAPPINGS["overflow"])
+
+    def test_unknown_error_uses_context(self):
+        """Test del mensaje genérico cuando no hay un término conocido"""
+        message = self.convert("algo inesperado", "Integración")
+        self.assertIn(" en Integración", message)
+        self.assertNotIn(" en ", self.convert("algo inesperado"))
+
+
+class TestExpressionCharacters(unittest.TestCase):
+    """Tests para el filtro de caracteres permitidos en expresiones"""
+
+    def test_valid_expressions(self):
+        """Test de expresiones con caracteres permitidos"""
+        for expr in ("x**2 - 4", "sin(x) + cos(x)", "exp(-x^2)/2", "", "abs(x) >= 1"):
+            with self.subTest(expr=expr):
+                self.assertTrue(is_valid_expr(expr))
+
+    def test_invalid_expressions(self):
+        """Test de expresiones con caracteres fuera de la lista"""
+        for expr in ("x²", "x; import os", "x @ y", "'x'", "x\n", "x % 2", "√x"):
+            with self.subTest(expr=expr):
+                self.assertFalse(is_valid_expr(expr))
+
+    def test_matches_per_character_check(self):
+        """Test que equivale a verificar cada carácter contra ALLOWED_CHARS"""
+        for expr in ("x**2 - 4", "x²", "a_b.c", "x$", "(1, 2)"):
+            with self.subTest(expr=expr):
+                self.assertEqual(is_valid_expr(expr), all(c in ALLOWED_CHARS for c in expr))
+
+
+class TestNumericInputs(unittest.TestCase):
+    """Tests para validate_numeric_inputs"""
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.validator = InputValidationMixin()
+
+    def validate(self, text):
+        return self.validator.validate_numeric_inputs({"x": FakeEntry(text)}, ["x"])
+
+    def test_valid_numbers(self):
+        """Test de conversión de enteros y decimales"""
+        cases = {"3": 3, "-4": -4, " 7 ": 7, "3.0": 3.0, "1e3": 1000.0, "0.25": 0.25}
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                is_valid, values, error = self.validate(text)
+                self.assertTrue(is_valid)
+                self.assertEqual(error, "")
+                self.assertEqual(values["x"], expected)
+                self.assertIs(type(values["x"]), type(expected))
+
+    def test_non_finite_rejected(self):
+        """Test que inf, nan y desbordes no se aceptan como números"""
+        for text in ("inf", "-inf", "Infinity", "nan", "NaN", "1e400", "-1e400"):
+            with self.subTest(text=text):
+                is_valid, values, error = self.validate(text)
+                self.assertFalse(is_valid)
+                self.assertEqual(values, {})
+                self.assertIn("número válido", error)
+
+    def test_invalid_and_missing(self):
+        """Test de texto no numérico, campo vacío y campo inexistente"""
+        self.assertFalse(self.validate("abc")[0])
+        self.assertIn("vacío", self.validate("  ")[2])
+        is_valid, _, error = self.validator.validate_numeric_inputs({}, ["x"])
+        self.assertFalse(is_valid)
+        self.assertIn("no encontrado", error)
+
+
+class TestIterationMatrix(unittest.TestCase):
+    """Tests para el formateo vectorizado de tablas de iteraciones"""
+
+    KEYS = ("a", "b", "c", "f_c", "error")
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        # Errores en ambos lados del umbral 0.0001, ceros con signo y negativos
+        errors = [0.0, -0.0, 1e-7, -3.5e-9, 0.0001, 0.00009999, 0.5, -2.25, 12345.678, float("nan")]
+        self.rows = [
+            {"a": 1, "b": 2.5, "c": -1.75 * i, "f_c": 1e-9 * i, "error": error}
+            for i, error in enumerate(errors)
+        ]
+        # Una fila sin 'f_c': las claves faltantes valen 0
+        del self.rows[3]["f_c"]
+
+    def reference(self, rows):
+        """Formato fila por fila con format_decimal_number para el error"""
+        return [[f"{row.get(key, 0):.6f}" for key in self.KEYS[:-1]]
+                + [format_decimal_number(row.get("error", 0), 8)]
+                for row in rows]
+
+    def test_rows_match_format_decimal_number(self):
+        """Test que la versión vectorizada coincide con el formato por valor"""
+        self.assertEqual(format_iteration_matrix(self.rows, self.KEYS), self.reference(self.rows))
+
+    def test_columnar_matches_rows(self):
+        """Test que los datos por columnas producen las mismas filas"""
+        columns = {key: np.array([row.get(key, 0) for row in self.rows], dtype=float)
+                   for key in self.KEYS if key != "b"}
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        self.assertEqual(format_iteration_matrix(columns, self.KEYS), self.reference(rows))
+
+    def test_empty_data(self):
+        """Test que una tabla vacía no genera filas"""
+        self.assertEqual(format_iteration_matrix([], self.KEYS), [])
+
+
+class TestMultipleFunctionsPlot(unittest.TestCase):
+    """Tests para plot_multiple_functions con valores no finitos"""
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.plotter = PlottingMixin()
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot()
+
+    def test_autoscale_ignores_non_finite(self):
+        """Test que inf y nan no rompen el autoescalado de la LineCollection"""
+        x_range = (-2, 2)
+        functions = [
+            (lambda x: 1 / x, "red", "1/x"),       # inf en x = 0
+            (lambda x: np.log(x), "blue", "ln(x)"),  # nan para x < 0, -inf en x = 0
+            (lambda x: x**2, "green", "x²"),
+        ]
+        self.plotter.plot_multiple_functions(self.fig, self.ax, functions, x_range)
+
+        collections = [c for c in self.ax.collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(collections), 1)
+
+        # Los límites son finitos y cubren los valores finitos de todas las curvas
+        x_vals = np.linspace(*x_range, 201)
+        with np.errstate(all="ignore"):
+            y_vals = np.concatenate([func(x_vals) for func, _, _ in functions])
+        finite = y_vals[np.isfinite(y_vals)]
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        self.assertTrue(np.isfinite([x_min, x_max, y_min, y_max]).all())
+        self.assertLessEqual(x_min, x_range[0])
+        self.assertGreaterEqual(x_max, x_range[1])
+        self.assertLessEqual(y_min, finite.min())
+        self.assertGreaterEqual(y_max, finite.max())
+
+        labels = [text.get_text() for text in self.ax.get_legend().get_texts()]
+        self.assertEqual(labels, ["1/x", "ln(x)", "x²"])
+
+    def test_all_nan_curve(self):
+        """Test que una curva sin valores finitos deja límites finitos"""
+        functions = [(lambda x: np.full_like(x, np.nan), "red", "nan")]
+        self.plotter.plot_multiple_functions(self.fig, self.ax, functions, (0, 1))
+        self.assertTrue(np.isfinite(self.ax.get_xlim() + self.ax.get_ylim()).all())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)